@@ -5,10 +5,17 @@ This module creates a graphical user interface for the Tic-Tac-Toe game
 using Tkinter, allowing players to interact with the AI through button clicks.
 """
 
+import functools  # Import functools to bind each cell's index to the shared click handler
 import tkinter as tk  # Import the GUI framework for creating the user interface
 from tkinter import messagebox  # Import message box for displaying game results
+from time import perf_counter  # Import high-resolution timer to measure AI thinking time
 from tictactoe_logic import TicTacToe, find_best_move  # Import our game logic and AI
 
+# Reason: The AI answers in well under a millisecond, which would make the "AI is thinking..."
+# message flash by unseen; pad fast answers up to this total so the turn change stays readable
+AI_MIN_TURN_MS = 80  # Minimum time between the player's move and the AI's reply
+SYMBOL_COLORS = {'X': 'blue', 'O': 'red', '': 'black'}  # Button text color for each cell symbol
+
 
 class TicTacToeGUI:
     """
@@ -18,15 +25,24 @@ class TicTacToeGUI:
     between the visual interface and the underlying game logic.
     """
     
-    def __init__(self):
+    def __init__(self, root=None):
+        """
+        Build the game window.
+        
+        Args:
+            root (tk.Tk): Existing Tk root to build the game in (default: create a new one)
+        """
         # Reason: Initialize the GUI components and game state
         # We need both the visual elements and the game logic state
         
         self.game = TicTacToe()  # Create instance of game logic to track board state
         self.game_active = True  # Flag to control whether moves can be made
+        self.last_ai_elapsed_ms = 0.0  # Time the most recent AI search took, used to size the UX delay
         
         # Create the main application window
-        self.root = tk.Tk()  # Initialize the main window
+        # Reason: Creating a Tk interpreter is expensive, so callers such as the test suite can
+        # hand in one shared root instead of paying for a new interpreter per window
+        self.root = root if root is not None else tk.Tk()  # Use the given main window or create one
         self.root.title("Smart Tic-Tac-Toe with Minimax AI")  # Set window title
         self.root.geometry("400x600")  # Set window size (increased height from 500 to 600)
         self.root.resizable(False, False)  # Prevent window resizing for consistent layout
@@ -35,8 +51,9 @@ class TicTacToeGUI:
         self.setup_ui()  # Create all visual elements and layout
         
         # Force window geometry and layout updates
+        # Reason: update_idletasks only flushes pending geometry and redraw work; a full update()
+        # would also process user events before the application has finished starting up
         self.root.update_idletasks()  # Force layout calculation
-        self.root.update()  # Force window update
     
     def setup_ui(self):
         """Create and arrange all UI elements in the main window."""
@@ -66,21 +83,25 @@ class TicTacToeGUI:
         board_frame.pack(pady=20)  # Add frame to window with vertical padding
         
         # Create 3x3 grid of buttons for the game board
-        self.buttons = []  # Initialize list to store button references
-        for row in range(3):  # Create each row of buttons
-            button_row = []  # Initialize list for current row of buttons
-            for col in range(3):  # Create each button in the current row
-                button = tk.Button(  # Create individual game cell button
-                    board_frame,  # Parent container is the board frame
-                    text="",  # Initially empty text
-                    width=6,  # Button width in characters
-                    height=3,  # Button height in characters
-                    font=("Arial", 20, "bold"),  # Large font for X and O symbols
-                    command=lambda r=row, c=col: self.player_move(r, c)  # Button click handler
-                )
-                button.grid(row=row, column=col, padx=2, pady=2)  # Position button in grid
-                button_row.append(button)  # Add button to current row list
-            self.buttons.append(button_row)  # Add completed row to main button list
+        # Reason: Buttons are stored flat, indexed like the bitboards (index = row * 3 + col),
+        # so a click handler addresses its button and its board bit with the same single index
+        self.buttons = []  # Initialize flat list of the 9 button references
+        # Reason: Python-side mirrors of each button's text and state answer queries without a
+        # Tcl round trip; every button text/state change below updates them alongside
+        self.cell_text = [''] * 9  # Text shown on each button, same order as self.buttons
+        self.cell_state = ['normal'] * 9  # Tk state of each button, same order as self.buttons
+        for index in range(9):  # Create each button in row-major order
+            row, col = divmod(index, 3)  # Grid position of this button
+            button = tk.Button(  # Create individual game cell button
+                board_frame,  # Parent container is the board frame
+                text="",  # Initially empty text
+                width=6,  # Button width in characters
+                height=3,  # Button height in characters
+                font=("Arial", 20, "bold"),  # Large font for X and O symbols
+                command=functools.partial(self._cell_clicked, index)  # Shared handler bound to this cell
+            )
+            button.grid(row=row, column=col, padx=2, pady=2)  # Position button in grid
+            self.buttons.append(button)  # Add button to flat button list
         
         # Create control buttons frame
         controls_frame = tk.Frame(self.root, bg="lightgray", relief="raised", bd=2)  # Create container with visible background and border
@@ -130,9 +151,9 @@ class TicTacToeGUI:
         # Reason: Prevent fast-clicking bug by disabling all board buttons during AI turn
         # This ensures only one move per turn and maintains game integrity
         
-        for row in range(3):  # Iterate through each row of buttons
-            for col in range(3):  # Iterate through each button in the row
-                self.buttons[row][col].config(state='disabled')  # Disable button to prevent clicks
+        for button in self.buttons:  # Iterate through each board button
+            button.config(state='disabled')  # Disable button to prevent clicks
+        self.cell_state[:] = ['disabled'] * 9  # Mirror the new states
     
     def enable_board(self):
         """
@@ -144,11 +165,35 @@ class TicTacToeGUI:
         # Reason: Selectively re-enable only empty cells after AI move completes
         # This maintains game rules while allowing player to continue their turn
         
-        for row in range(3):  # Iterate through each row of buttons
-            for col in range(3):  # Iterate through each button in the row
-                button_text = self.buttons[row][col].cget("text")  # Get current button text content
-                if button_text == "":  # Check if the cell is empty (no X or O)
-                    self.buttons[row][col].config(state='normal')  # Re-enable button for clicking
+        # Reason: The game logic is the source of truth for which cells are empty, so a board
+        # changed without _set_cell still enables exactly the playable buttons; no Tcl query needed
+        for row, col in self.game.get_available_moves():  # Iterate through each empty cell
+            index = row * 3 + col  # Flat index of the cell's button
+            self.buttons[index].config(state='normal')  # Re-enable button for clicking
+            self.cell_state[index] = 'normal'  # Mirror the new state
+    
+    def _set_cell(self, row, col, symbol):
+        """
+        Write a symbol to a cell in both the game logic and its button.
+        
+        Args:
+            row (int): Row index of the cell (0-2)
+            col (int): Column index of the cell (0-2)
+            symbol (str): 'X', 'O' or '' to clear the cell
+        """
+        # Reason: Every cell change needs the same logic write and one combined button update,
+        # so a single configure call sets text, color and state in one Tcl round trip
+        
+        index = row * 3 + col  # Flat index of the cell
+        state = 'disabled' if symbol else 'normal'  # Occupied cells cannot be clicked
+        self.game.set_cell(row, col, symbol)  # Update game logic bitboards
+        self.buttons[index].config(  # Update button display in one call
+            text=symbol,  # Show the symbol
+            fg=SYMBOL_COLORS[symbol],  # Color of the symbol
+            state=state  # Clickable only while empty
+        )
+        self.cell_text[index] = symbol  # Mirror the new text
+        self.cell_state[index] = state  # Mirror the new state
     
     def player_move(self, row, col):
         """
@@ -158,32 +203,43 @@ class TicTacToeGUI:
             row (int): Row index of the clicked button (0-2)
             col (int): Column index of the clicked button (0-2)
         """
+        self._cell_clicked(row * 3 + col)  # Dispatch to the flat-index click handler
+    
+    def _cell_clicked(self, index):
+        """
+        Handle a click on the board button at a flat cell index.
+        
+        Args:
+            index (int): Flat index of the clicked cell (row * 3 + col, 0-8)
+        """
         # Reason: This method coordinates player input with game logic and GUI updates
         # It validates the move, updates the display, and triggers the AI response
         
         if not self.game_active:  # Check if the game is still active
             return  # Exit early if game has ended
         
-        if self.game.board[row][col] != '':  # Check if the clicked cell is already occupied
+        if (self.game.x | self.game.o) >> index & 1:  # Check the cell's bit in both bitboards
             self.update_status("Cell already taken! Try another cell.", "orange")  # Show error message
             return  # Exit early without making a move
         
         # Make the player's move
-        self.game.board[row][col] = 'X'  # Update game logic board state
-        self.buttons[row][col].config(text='X', fg='blue')  # Update button display
+        row, col = divmod(index, 3)  # Grid coordinates for the game logic
+        self._set_cell(row, col, 'X')  # Update game logic and button display
         
         # Immediately disable the board to prevent fast-clicking
         self.disable_board()  # Prevent multiple moves by disabling all buttons
         
+        state = self.game.terminal_state()  # Win and draw check in one lookup
+        
         # Check if player won
-        if self.game.check_winner('X'):  # Check if player's move resulted in a win
+        if state == 'X':  # Check if player's move resulted in a win
             self.update_status("Congratulations! You won!", "green")  # Show win message
             self.game_active = False  # Disable further moves
             # Note: Board remains disabled since game is over
             return  # Exit since game is over
         
         # Check if game is a draw
-        if self.game.is_draw():  # Check if the board is full with no winner
+        if state == 'draw':  # Check if the board is full with no winner
             self.update_status("It's a draw! Good game!", "purple")  # Show draw message
             self.game_active = False  # Disable further moves
             # Note: Board remains disabled since game is over
@@ -191,8 +247,15 @@ class TicTacToeGUI:
         
         # If game continues, trigger AI move
         self.update_status("AI is thinking...", "orange")  # Show AI thinking message
-        self.root.update()  # Force GUI update to show status change immediately
-        self.root.after(500, self.ai_move)  # Schedule AI move after 500ms delay for better UX
+        
+        # Reason: Returning to the event loop lets Tk redraw the status label on its own before
+        # the AI runs, instead of re-entering the event loop with root.update() mid-handler
+        # Only fast searches are padded; a slow search already makes the message visible
+        delay_ms = max(0, AI_MIN_TURN_MS - int(self.last_ai_elapsed_ms))  # Padding still needed
+        if delay_ms > 0:  # Search is fast enough that the message would flash by
+            self.root.after(delay_ms, self.ai_move)  # Schedule AI move after the remaining padding
+        else:  # Search itself takes long enough
+            self.root.after_idle(self.ai_move)  # Run AI move as soon as pending redraws are done
     
     def ai_move(self):
         """Execute the AI's move using the minimax algorithm."""
@@ -202,7 +265,12 @@ class TicTacToeGUI:
         if not self.game_active:  # Check if the game is still active
             return  # Exit early if game has ended
         
+        start_time = perf_counter()  # Start timing the AI search
+        # Reason: Every position a game through this window reaches is answered from the precomputed
+        # policy table before any search runs, so no time budget is passed; budget_ms stays
+        # available in the library for callers that search arbitrary positions
         best_move = find_best_move(self.game)  # Get optimal move from AI algorithm
+        self.last_ai_elapsed_ms = (perf_counter() - start_time) * 1000  # Remember search time in ms
         
         if best_move is None:  # Check if no moves are available (shouldn't happen)
             return  # Exit early if no valid moves
@@ -210,18 +278,19 @@ class TicTacToeGUI:
         row, col = best_move  # Unpack the AI's chosen move coordinates
         
         # Make the AI's move
-        self.game.board[row][col] = 'O'  # Update game logic board state
-        self.buttons[row][col].config(text='O', fg='red')  # Update button display
+        self._set_cell(row, col, 'O')  # Update game logic and button display
+        
+        state = self.game.terminal_state()  # Win and draw check in one lookup
         
         # Check if AI won
-        if self.game.check_winner('O'):  # Check if AI's move resulted in a win
+        if state == 'O':  # Check if AI's move resulted in a win
             self.update_status("AI wins! Better luck next time!", "red")  # Show AI win message
             self.game_active = False  # Disable further moves
             # Note: Board remains disabled since game is over
             return  # Exit since game is over
         
         # Check if game is a draw
-        if self.game.is_draw():  # Check if the board is full with no winner
+        if state == 'draw':  # Check if the board is full with no winner
             self.update_status("It's a draw! Good game!", "purple")  # Show draw message
             self.game_active = False  # Disable further moves
             # Note: Board remains disabled since game is over
@@ -249,26 +318,27 @@ class TicTacToeGUI:
         # Reason: When the game ends, we need to prevent additional button clicks
         # This provides clear visual feedback that the game is over
         
-        for row in range(3):  # Iterate through each row of buttons
-            for col in range(3):  # Iterate through each button in the row
-                self.buttons[row][col].config(state='disabled')  # Disable the button
+        for button in self.buttons:  # Iterate through each board button
+            button.config(state='disabled')  # Disable the button
+        self.cell_state[:] = ['disabled'] * 9  # Mirror the new states
     
     def restart_game(self):
         """Reset the game to its initial state for a new game."""
         # Reason: Allow players to start a new game without restarting the application
         # This resets both the game logic and the visual interface
         
-        self.game = TicTacToe()  # Create new game instance with empty board
+        self.game.reset()  # Clear the existing game in place instead of allocating a new one
         self.game_active = True  # Re-enable game interactions
         
         # Reset all buttons to their initial state
-        for row in range(3):  # Iterate through each row of buttons
-            for col in range(3):  # Iterate through each button in the row
-                self.buttons[row][col].config(  # Reset button configuration
-                    text="",  # Clear button text
-                    state='normal',  # Re-enable button
-                    fg='black'  # Reset text color
-                )
+        for button in self.buttons:  # Iterate through each board button
+            button.config(  # Reset button configuration
+                text="",  # Clear button text
+                state='normal',  # Re-enable button
+                fg='black'  # Reset text color
+            )
+        self.cell_text[:] = [''] * 9  # Mirror the cleared texts
+        self.cell_state[:] = ['normal'] * 9  # Mirror the enabled states
         
         self.update_status("Your Turn! Click any cell to start.", "green")  # Reset status message
     
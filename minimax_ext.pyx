@@ -0,0 +1,66 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Native negamax search kernel for the Smart Tic-Tac-Toe AI.
+
+This optional Cython module returns the same scores as _negamax_kernel in
+tictactoe_search.py, so the full-depth search runs as C code without Numba's
+import and JIT cost.
+Build it in place with: cythonize -i minimax_ext.pyx
+"""
+
+# Reason: Same move order as MOVE_ORDER_INDICES in tictactoe_tables.py (center, corners, edges)
+# so the native kernel prunes exactly like the Python one
+cdef int MOVE_ORDER[9]  # Flat cell indices in search order
+MOVE_ORDER[:] = [4, 0, 2, 6, 8, 1, 3, 5, 7]  # Center, corners, edges
+cdef int MAX_SCORE = 10  # Same bound as MAX_SCORE in tictactoe_tables.py
+
+
+cdef int c_negamax(int mover, int opponent, int remaining, int alpha, int beta,
+                   const unsigned char *win_bitmap) noexcept nogil:
+    """Score a board for the side to move, exact if inside (alpha, beta), otherwise a bound."""
+    cdef int occupied, best_score, score, index, bit  # Typed locals keep the loop in plain C
+
+    if win_bitmap[opponent]:  # Check if the side that just moved has won
+        return -remaining - 1  # Return negative score, the side to move has lost
+    if win_bitmap[mover]:  # Check if the side to move already has a line (hand-built boards)
+        return remaining + 1  # Return positive score, the side to move has won
+    if remaining == 0:  # Board is full with no winner
+        return 0  # Return neutral score for draw
+
+    occupied = mover | opponent  # Bitboard of all occupied cells
+    best_score = -MAX_SCORE  # Worse than any real score for the side to move
+    for index in range(9):  # Try each move, strongest squares first
+        bit = 1 << MOVE_ORDER[index]  # Bit representing this cell
+        if occupied & bit:  # Skip occupied cells
+            continue  # Move on to the next candidate square
+        score = -c_negamax(opponent, mover | bit, remaining - 1, -beta, -alpha, win_bitmap)  # Make the move
+        if score > best_score:  # Found a better move for the side to move
+            best_score = score  # Keep track of the highest score found
+            if score == remaining:  # Winning with this very move cannot be beaten
+                break  # Skip the remaining moves
+            if score > alpha:  # Raise the score the side to move is guaranteed
+                alpha = score  # New lower bound
+                if alpha >= beta:  # The opponent will never allow this line
+                    break  # Prune the remaining moves
+    return best_score  # Return the best score for the side to move
+
+
+def negamax(int mover, int opponent, int remaining, int alpha, int beta, const unsigned char[:] win_bitmap):
+    """
+    Plain negamax alpha-beta search over bitboards, compiled to C.
+
+    Args:
+        mover (int): Bitboard of the side to move
+        opponent (int): Bitboard of the side that just moved
+        remaining (int): Number of empty cells, i.e. plies until the board is full
+        alpha (int): Lower bound of the search window, for the side to move
+        beta (int): Upper bound of the search window, for the side to move
+        win_bitmap (bytes): WIN_BITMAP from tictactoe_tables (512 win flags)
+
+    Returns:
+        int: Score for the side to move, exact if inside (alpha, beta), otherwise a bound
+    """
+    cdef int score  # Result of the native search
+    with nogil:  # The search touches no Python objects
+        score = c_negamax(mover, opponent, remaining, alpha, beta, &win_bitmap[0])  # Run the C search
+    return score  # Return the score as a Python int
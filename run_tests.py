@@ -10,6 +10,13 @@ import sys  # Import system functionality for exit codes and path management
 import os  # Import os module for file system operations
 import traceback  # Import traceback for detailed error reporting
 import importlib.util  # Import utility for dynamic module loading
+import importlib.machinery  # Import machinery for the bytecode-caching source loader
+import py_compile  # Import py_compile to warm the bytecode cache before loading tests
+import io  # Import io to capture each test module's output in memory
+import contextlib  # Import contextlib to redirect stdout while a module runs
+import inspect  # Import inspect to find tests that expect pytest fixtures
+import functools  # Import functools to bind parametrized arguments to a test
+from concurrent.futures import ProcessPoolExecutor  # Import process pool to run test files in parallel
 
 def load_module_from_file(filepath):
     """
@@ -24,10 +31,15 @@ def load_module_from_file(filepath):
     # Reason: Load test modules dynamically to run tests without pytest
     # This allows us to discover and execute test functions programmatically
     
+    # Reason: SourceFileLoader reads fresh bytecode from __pycache__ when it exists, skipping
+    # the parse and compile steps; registering in sys.modules lets other imports share the module
+    
     module_name = os.path.basename(filepath).replace('.py', '')  # Extract module name from filename
-    spec = importlib.util.spec_from_file_location(module_name, filepath)  # Create module specification
+    loader = importlib.machinery.SourceFileLoader(module_name, filepath)  # Loader that uses cached bytecode
+    spec = importlib.util.spec_from_loader(module_name, loader)  # Create module specification
     module = importlib.util.module_from_spec(spec)  # Create module from specification
-    spec.loader.exec_module(module)  # Execute the module to load its contents
+    sys.modules[module_name] = module  # Register before executing so imports resolve to this instance
+    loader.exec_module(module)  # Execute the module to load its contents
     return module  # Return the loaded module
 
 def discover_test_files(test_dir):
@@ -43,13 +55,15 @@ def discover_test_files(test_dir):
     # Reason: Find all test files automatically for comprehensive test execution
     # This ensures we don't miss any tests when adding new ones
     
-    test_files = []  # Initialize list to store test file paths
-    
-    for filename in os.listdir(test_dir):  # Iterate through all files in test directory
-        if filename.startswith('test_') and filename.endswith('.py'):  # Check if file is a test file
-            test_files.append(os.path.join(test_dir, filename))  # Add full path to test files list
+    # Reason: scandir entries already carry the full path and their file type from the directory
+    # listing, so no os.path.join or extra stat call is needed per file
     
-    return test_files  # Return list of discovered test files
+    with os.scandir(test_dir) as entries:  # Stream directory entries
+        return [  # Full paths of discovered test files
+            entry.path for entry in entries  # Path already includes the directory
+            if entry.name.startswith('test_') and entry.name.endswith('.py')  # Test file naming
+            and entry.is_file(follow_symlinks=False)  # Regular files only, no extra stat for symlinks
+        ]
 
 def run_test_function(test_func, test_name):
     """
@@ -77,75 +91,214 @@ def run_test_function(test_func, test_name):
         print(traceback.format_exc())  # Print detailed error traceback
         return False  # Return failure status
 
-def run_tests_in_module(module, module_name):
+def expand_parametrize(test_func, test_name):
+    """
+    Expand a test decorated with @pytest.mark.parametrize into one call per case.
+    
+    Args:
+        test_func (callable): The test function to expand
+        test_name (str): Name of the test for reporting
+        
+    Returns:
+        list: (case_name, callable) pairs, or None if the test needs pytest fixtures
+    """
+    # Reason: pytest stores parametrize marks on the function itself, so simple cases can be
+    # replayed here without pytest; anything else (fixtures) is left to pytest
+    
+    parameters = inspect.signature(test_func).parameters  # Arguments the test expects
+    if not parameters:  # Plain test without arguments
+        return [(test_name, test_func)]  # Run it as is
+    
+    marks = [mark for mark in getattr(test_func, 'pytestmark', []) if mark.name == 'parametrize']
+    if len(marks) != 1:  # No parametrization, or stacked ones this runner does not combine
+        return None  # Arguments must come from pytest fixtures
+    argnames, argvalues = marks[0].args[:2]  # Names and values of each case
+    if isinstance(argnames, str):  # "a, b" style names
+        argnames = [name.strip() for name in argnames.split(',')]  # Split into a list of names
+    if set(argnames) != set(parameters):  # Some arguments are fixtures
+        return None  # Leave the test to pytest
+    ids = marks[0].kwargs.get('ids') or [str(index) for index in range(len(argvalues))]  # Case labels
+    
+    cases = []  # Collect one bound callable per case
+    for case_id, values in zip(ids, argvalues):  # Build every case
+        if len(argnames) == 1:  # Single argument cases are given unwrapped
+            values = (values,)  # Wrap so it can be zipped with the names
+        arguments = dict(zip(argnames, values))  # Map argument names to this case's values
+        cases.append((f"{test_name}[{case_id}]", functools.partial(test_func, **arguments)))  # Bind case
+    return cases  # Return all cases of the test
+
+
+def is_slow(test_func):
+    """
+    Check whether a test is marked with @pytest.mark.slow.
+    
+    Args:
+        test_func (callable): The test function to check
+        
+    Returns:
+        bool: True if the test carries the slow marker
+    """
+    # Reason: pytest.ini leaves slow tests out of the default run, so this runner honours the same
+    # marker instead of silently running the expensive exhaustive checks every time
+    return any(mark.name == 'slow' for mark in getattr(test_func, 'pytestmark', []))  # Look for the marker
+
+def skipif_reason(test_func):
+    """
+    Find the reason of a @pytest.mark.skipif marker whose condition holds.
+    
+    Args:
+        test_func (callable): The test function to check
+        
+    Returns:
+        str: Reason given to the first true skipif marker, or None if the test should run
+    """
+    # Reason: Tests for optional parts (such as the Cython kernel) skip themselves through
+    # skipif when those parts are missing, so the runner honours the same condition as pytest
+    for mark in getattr(test_func, 'pytestmark', []):  # Every marker on the test
+        if mark.name == 'skipif' and mark.args and mark.args[0]:  # Condition holds
+            return mark.kwargs.get('reason', 'skipif condition is true')  # Report why it is skipped
+    return None  # No marker asks to skip the test
+
+def run_tests_in_module(module, module_name, include_slow=False):
     """
     Run all test methods in a given module.
     
     Args:
         module: The test module to execute
         module_name (str): Name of the module for reporting
+        include_slow (bool): Also run tests marked slow (default: False)
         
     Returns:
-        tuple: (passed_count, total_count)
+        tuple: (passed_count, total_count, skipped_count)
     """
     # Reason: Execute all test methods within a module systematically
     # This handles both function-based and class-based test structures
     
     passed = 0  # Initialize counter for passed tests
     total = 0  # Initialize counter for total tests
+    skipped = 0  # Initialize counter for tests that need pytest fixtures or are marked slow
     
     print(f"\n🧪 Running tests in {module_name}")  # Print module header
     print("-" * 50)  # Print separator line
     
-    # Find and run test functions
-    for name in dir(module):  # Iterate through all names in the module
-        if name.startswith('test_'):  # Check if name is a test function
-            test_func = getattr(module, name)  # Get the actual function object
-            if callable(test_func):  # Verify it's actually callable
+    # Reason: Scan the module namespace once instead of calling dir() twice; __dict__ keeps
+    # definition order, needs no sorting and already pairs each name with its object
+    test_functions = []  # Collect (name, function) pairs of module-level tests
+    test_classes = []  # Collect (name, class, [(method name, function)]) of test classes
+    for name, obj in module.__dict__.items():  # Single pass over everything defined in the module
+        if name.startswith('test_') and callable(obj):  # Module-level test function
+            test_functions.append((name, obj))  # Remember function for execution
+        elif name.startswith('Test') and isinstance(obj, type):  # Test class
+            # Only methods defined on the class itself, so inherited helpers are not run as tests
+            # Keep the plain functions so each instance can bind them without another lookup
+            test_methods = [(method_name, function) for method_name, function in vars(obj).items()
+                            if method_name.startswith('test_') and callable(function)]
+            test_classes.append((name, obj, test_methods))  # Remember class with its test methods
+    
+    # Reason: Module-level setup_function/teardown_function hooks (pytest's xunit style) run around
+    # every test function, so tests sharing module state all start from the same point
+    setup_function = module.__dict__.get('setup_function')  # Optional hook run before each test
+    teardown_function = module.__dict__.get('teardown_function')  # Optional hook run after each test
+    
+    # Run test functions
+    for name, test_func in test_functions:  # Iterate through collected test functions
+        if not include_slow and is_slow(test_func):  # Expensive test not requested
+            print(f"⏭️  {module_name}.{name} - SKIPPED: marked slow (run with --slow)")  # Report skipped test
+            skipped += 1  # Increment skipped count
+            continue  # Move on to the next test
+        reason = skipif_reason(test_func)  # Condition-based skip, as pytest would apply it
+        if reason is not None:  # Test does not apply to this environment
+            print(f"⏭️  {module_name}.{name} - SKIPPED: {reason}")  # Report skipped test
+            skipped += 1  # Increment skipped count
+            continue  # Move on to the next test
+        # Reason: Tests whose arguments are not all parametrized expect pytest fixtures (see
+        # tests/conftest.py), which this runner does not provide, so report them as skipped
+        cases = expand_parametrize(test_func, f"{module_name}.{name}")  # Calls to make for this test
+        if cases is None:  # Test asks for fixtures
+            print(f"⏭️  {module_name}.{name} - SKIPPED: needs pytest fixtures")  # Report skipped test
+            skipped += 1  # Increment skipped count
+            continue  # Move on to the next test
+        for case_name, case_func in cases:  # Run every case of the test
+            total += 1  # Increment total test count
+            if setup_function is not None:  # Module defines a per-test setup hook
+                setup_function()  # Reset shared state before the test
+            if run_test_function(case_func, case_name):  # Run the test case
+                passed += 1  # Increment passed count if successful
+            if teardown_function is not None:  # Module defines a per-test teardown hook
+                teardown_function()  # Clean up after the test
+    
+    # Run test classes
+    for name, obj, test_methods in test_classes:  # Iterate through collected test classes
+        # Reason: Setup/teardown availability is a property of the class, so look it up once
+        # per class instead of repeating hasattr() on every fresh instance
+        has_setup = hasattr(obj, 'setup_method')  # Check for setup method once per class
+        has_teardown = hasattr(obj, 'teardown_method')  # Check for teardown method once per class
+        
+        # Run each test method with a fresh instance for proper isolation
+        for method_name, function in test_methods:  # Iterate through test methods
+            try:
+                test_instance = obj()  # Create fresh instance for each test
+                
+                # Run setup if it exists
+                if has_setup:  # Class defines a setup method
+                    test_instance.setup_method()  # Run setup before test
+                
+                # Run the specific test method
+                test_method = function.__get__(test_instance, obj)  # Bind cached function to this instance
                 total += 1  # Increment total test count
-                if run_test_function(test_func, f"{module_name}.{name}"):  # Run the test
+                if run_test_function(test_method, f"{module_name}.{name}.{method_name}"):  # Run test
                     passed += 1  # Increment passed count if successful
-    
-    # Find and run test classes
-    for name in dir(module):  # Iterate through all names in the module again
-        obj = getattr(module, name)  # Get the object
-        if (isinstance(obj, type) and name.startswith('Test')):  # Check if it's a test class
-            # Get all test methods first
-            test_methods = []  # Initialize list for test methods
-            for method_name in dir(obj):  # Iterate through class methods
-                if method_name.startswith('test_'):  # Check if method is a test
-                    test_methods.append(method_name)  # Add to test methods list
-            
-            # Run each test method with a fresh instance for proper isolation
-            for method_name in test_methods:  # Iterate through test methods
-                try:
-                    test_instance = obj()  # Create fresh instance for each test
-                    
-                    # Run setup if it exists
-                    if hasattr(test_instance, 'setup_method'):  # Check for setup method
-                        test_instance.setup_method()  # Run setup before test
-                    
-                    # Run the specific test method
-                    test_method = getattr(test_instance, method_name)  # Get the test method
-                    total += 1  # Increment total test count
-                    if run_test_function(test_method, f"{module_name}.{name}.{method_name}"):  # Run test
-                        passed += 1  # Increment passed count if successful
+                
+                # Run teardown if it exists
+                if has_teardown:  # Class defines a teardown method
+                    test_instance.teardown_method()  # Run cleanup after test
                     
-                    # Run teardown if it exists
-                    if hasattr(test_instance, 'teardown_method'):  # Check for teardown method
-                        test_instance.teardown_method()  # Run cleanup after test
-                        
-                except Exception as e:  # Catch any setup/teardown errors
-                    print(f"💥 {module_name}.{name}.{method_name} - SETUP/TEARDOWN ERROR: {e}")  # Report error
-                    total += 1  # Count as one failed test
-    
-    return passed, total  # Return test results
+            except Exception as e:  # Catch any setup/teardown errors
+                print(f"💥 {module_name}.{name}.{method_name} - SETUP/TEARDOWN ERROR: {e}")  # Report error
+                total += 1  # Count as one failed test
+    
+    return passed, total, skipped  # Return test results
+
+def run_test_file(test_file, include_slow=False):
+    """
+    Load a test file, run all of its tests and capture the printed report.
+    
+    Args:
+        test_file (str): Path to the test file to run
+        include_slow (bool): Also run tests marked slow (default: False)
+        
+    Returns:
+        tuple: (module_name, passed_count, total_count, skipped_count, captured_output)
+    """
+    # Reason: Each file runs in its own worker process, so its output is captured and handed
+    # back to the parent, which prints whole reports in order instead of interleaved lines
+    
+    # Reason: Test modules import the project modules directly, so the project root must be
+    # importable in every worker, including spawned ones that do not inherit sys.path changes
+    project_root = os.path.dirname(os.path.abspath(__file__))  # Directory holding the project modules
+    if project_root not in sys.path:  # Not importable yet in this process
+        sys.path.insert(0, project_root)  # Make main and tictactoe_logic importable
+    
+    module_name = os.path.basename(test_file).replace('.py', '')  # Extract module name
+    passed, total, skipped = 0, 0, 0  # Default counts if the module fails to load
+    output = io.StringIO()  # Buffer for everything the tests print
+    with contextlib.redirect_stdout(output):  # Capture the module's report
+        try:
+            module = load_module_from_file(test_file)  # Load the test module
+            passed, total, skipped = run_tests_in_module(module, module_name, include_slow)  # Run tests in module
+        except Exception as e:  # Catch module loading errors
+            print(f"💥 Failed to load {test_file}: {e}")  # Report loading error
+            print(traceback.format_exc())  # Print detailed error
+    return module_name, passed, total, skipped, output.getvalue()  # Return results with captured report
 
 def main():
     """Main test runner function."""
     # Reason: Coordinate the entire test execution process
     # This provides a comprehensive test run with summary reporting
     
+    # Reason: Match pytest.ini, which deselects slow tests unless asked with "pytest -m slow"
+    include_slow = '--slow' in sys.argv[1:]  # Opt in to the expensive exhaustive tests
+    
     print("🚀 Smart Tic-Tac-Toe Test Runner")  # Print header
     print("=" * 50)  # Print main separator
     
@@ -166,26 +319,38 @@ def main():
         print("⚠️  No test files found!")  # Report no tests
         sys.exit(1)  # Exit with error code
     
+    # Compile every test file up front so each loader (and every later run) hits the cache
+    for test_file in test_files:  # Iterate through all discovered test files
+        py_compile.compile(test_file, doraise=False)  # Write bytecode to __pycache__, ignore syntax errors here
+    
     total_passed = 0  # Initialize total passed counter
     total_tests = 0  # Initialize total tests counter
+    total_skipped = 0  # Initialize skipped tests counter
+    
+    # Reason: Test files are independent, so run them in parallel worker processes
+    # A single file gains nothing from a pool, so it runs in-process to skip worker startup
+    if len(test_files) == 1:  # Nothing to parallelize
+        results = [run_test_file(test_files[0], include_slow)]  # Run the only file serially
+    else:
+        sys.stdout.flush()  # Flush the header so forked workers do not inherit and repeat it
+        with ProcessPoolExecutor() as executor:  # One worker per CPU core by default
+            results = list(executor.map(  # Results come back in file order
+                run_test_file, test_files, [include_slow] * len(test_files)  # Same opt-in for every file
+            ))
     
     # Run tests in each file
-    for test_file in test_files:  # Iterate through all discovered test files
-        try:
-            module = load_module_from_file(test_file)  # Load the test module
-            module_name = os.path.basename(test_file).replace('.py', '')  # Extract module name
-            passed, total = run_tests_in_module(module, module_name)  # Run tests in module
-            total_passed += passed  # Add to overall passed count
-            total_tests += total  # Add to overall test count
-        except Exception as e:  # Catch module loading errors
-            print(f"💥 Failed to load {test_file}: {e}")  # Report loading error
-            print(traceback.format_exc())  # Print detailed error
+    for module_name, passed, total, skipped, output in results:  # Iterate through results of every test file
+        print(output, end='')  # Print the file's captured report
+        total_passed += passed  # Add to overall passed count
+        total_tests += total  # Add to overall test count
+        total_skipped += skipped  # Add to overall skipped count
     
     # Print summary
     print("\n" + "=" * 50)  # Print summary separator
     print(f"📊 Test Results Summary")  # Print summary header
     print(f"✅ Passed: {total_passed}")  # Report passed count
     print(f"❌ Failed: {total_tests - total_passed}")  # Report failed count
+    print(f"⏭️  Skipped: {total_skipped} (see SKIPPED lines above for why)")  # Report skipped count
     print(f"📈 Total:  {total_tests}")  # Report total count
     
     if total_passed == total_tests:  # Check if all tests passed
@@ -196,6 +361,6 @@ def main():
         sys.exit(1)  # Exit with error code
 
 # Reason: Run the test suite when this file is executed directly
-# This allows easy execution of all tests with "python3 run_tests.py"
+# This allows easy execution of all tests with "python3 run_tests.py" (add --slow for slow tests)
 if __name__ == "__main__":
     main()  # Execute the main test runner 
\ No newline at end of file
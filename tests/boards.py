@@ -0,0 +1,11 @@
+"""
+Board fixtures shared by the Smart Tic-Tac-Toe logic tests.
+"""
+
+# Reason: Shared, immutable board fixtures are built once at import instead of in every test
+ALL_CELLS = frozenset((r, c) for r in range(3) for c in range(3))  # Every (row, col) on the board
+DRAW_BOARD_ROWS = (  # Full board with no line for either player
+    ('X', 'O', 'X'),
+    ('O', 'X', 'O'),
+    ('O', 'X', 'O'),
+)
@@ -0,0 +1,54 @@
+"""
+Shared pytest fixtures for the Smart Tic-Tac-Toe test suite.
+
+The GUI tests share a single Tk root and a single game window for the whole
+session; each test receives the window reset to the state of a new game.
+"""
+
+import contextlib  # Import contextlib to ignore errors while tearing down Tk
+import tkinter as tk  # Import Tkinter to create the shared root window
+
+import pytest  # Import pytest for fixture support
+
+from main import TicTacToeGUI  # Import GUI class shared by the GUI tests
+
+
+@pytest.fixture(scope="session")
+def tk_root():
+    """Create one hidden Tk root for the whole test session."""
+    # Reason: Creating a Tk interpreter dominates the cost of every GUI test, so it is created
+    # once; without a display (CI/CD environments) every test using it is skipped instead
+    
+    try:
+        root = tk.Tk()  # Create the shared Tk interpreter and main window
+    except tk.TclError as error:  # Handle case where no display is available
+        pytest.skip(f"Tk display not available: {error}")  # Skip all GUI tests
+    # Reason: Tk maps a new root in an idle callback and defers geometry requests of a window
+    # until it is first mapped, so let it map once before hiding it; otherwise geometry() would
+    # keep reporting the default size instead of the 400x600 the game window asks for
+    root.update_idletasks()  # Map the window and apply its pending geometry
+    root.withdraw()  # Keep the window off screen while testing
+    try:
+        yield root  # Hand the root to the tests
+    finally:
+        with contextlib.suppress(Exception):  # The interpreter may already be gone
+            root.destroy()  # Free the Tk resources at the end of the session
+
+
+@pytest.fixture(scope="session")
+def _gui(tk_root):
+    """Build the game window once on the shared Tk root."""
+    return TicTacToeGUI(root=tk_root)  # Create all widgets a single time
+
+
+@pytest.fixture
+def app(_gui):
+    """Provide the shared game window reset to the state of a new game."""
+    # Reason: Resetting the game and widgets is far cheaper than rebuilding the window and
+    # still gives every test the same clean starting state as a fresh TicTacToeGUI
+    
+    for after_id in _gui.root.tk.splitlist(_gui.root.tk.call('after', 'info')):  # Pending callbacks
+        _gui.root.after_cancel(after_id)  # Drop AI moves scheduled by an earlier test
+    _gui.restart_game()  # Clear the board, buttons and status message
+    _gui.last_ai_elapsed_ms = 0.0  # Forget timings recorded by earlier tests
+    return _gui  # Hand the clean window to the test
@@ -0,0 +1,266 @@
+"""
+Unit tests for the TicTacToe game state.
+
+This module verifies board reads and writes, the bitboards and running encoding
+behind them, win and draw detection, and the debugging printout.
+"""
+
+import contextlib  # Import contextlib to capture printed output
+import io  # Import io for an in-memory text buffer
+
+import pytest  # Import pytest for parametrized test cases
+
+from tests.boards import ALL_CELLS, DRAW_BOARD_ROWS  # Import the shared board fixtures
+from tictactoe_board import TicTacToe  # Import the game state to test
+from tictactoe_tables import encode_board  # Import the reference encoding of a flat board
+
+
+# TicTacToe class tests
+
+def test_init_creates_empty_board():
+    """Test that initialization creates a 3x3 empty board."""
+    # Reason: Verify the basic initialization works correctly
+    # This is the foundation for all other game functionality
+    
+    game = TicTacToe()  # Create new game instance
+    
+    # Check that board is 3x3
+    assert len(game.board) == 3  # Verify board has 3 rows
+    for row in game.board:  # Check each row in the board
+        assert len(row) == 3  # Verify each row has 3 columns
+    
+    # Check that all cells are empty
+    for row in range(3):  # Iterate through all row indices
+        for col in range(3):  # Iterate through all column indices
+            assert game.board[row][col] == ''  # Verify each cell is empty string
+
+
+def test_get_available_moves_empty_board():
+    """Test getting available moves on an empty board."""
+    # Reason: Verify that all 9 positions are available on a fresh board
+    # This tests the happy path scenario at game start
+    
+    game = TicTacToe()  # Create new game with empty board
+    moves = game.get_available_moves()  # Get list of available positions
+    
+    assert len(moves) == 9  # Verify all 9 positions are available
+    
+    # Check that all positions (0,0) through (2,2) are included
+    assert frozenset(moves) == ALL_CELLS  # Verify all positions are present (order doesn't matter)
+
+
+def test_get_available_moves_partial_board():
+    """Test getting available moves on a partially filled board."""
+    # Reason: Verify that only empty positions are returned as available
+    # This tests the edge case of a board with some moves already made
+    
+    game = TicTacToe()  # Create new game instance
+    
+    # Make some moves to fill specific positions
+    game.board[0][0] = 'X'  # Place X in top-left corner
+    game.board[1][1] = 'O'  # Place O in center position
+    game.board[2][2] = 'X'  # Place X in bottom-right corner
+    
+    moves = game.get_available_moves()  # Get remaining available positions
+    
+    assert len(moves) == 6  # Verify 6 positions remain available (9 - 3 = 6)
+    
+    # Verify that occupied positions are not in available moves
+    assert (0, 0) not in moves  # Top-left should not be available
+    assert (1, 1) not in moves  # Center should not be available
+    assert (2, 2) not in moves  # Bottom-right should not be available
+    
+    # Verify that empty positions are in available moves
+    assert (0, 1) in moves  # This position should be available
+    assert (1, 0) in moves  # This position should be available
+
+
+@pytest.mark.parametrize("placements, x_wins, o_wins", [
+    ([(0, 0, 'X'), (0, 1, 'X'), (0, 2, 'X')], True, False),  # Row 0 victory for X
+    ([(0, 1, 'O'), (1, 1, 'O'), (2, 1, 'O')], False, True),  # Column 1 victory for O
+    ([(0, 0, 'X'), (1, 1, 'X'), (2, 2, 'X')], True, False),  # Main diagonal victory for X
+    ([(0, 2, 'O'), (1, 1, 'O'), (2, 0, 'O')], False, True),  # Anti-diagonal victory for O
+    ([(0, 0, 'X'), (0, 1, 'O'), (1, 1, 'X'), (2, 0, 'O')], False, False),  # Scattered, no three in a row
+], ids=["row", "column", "diagonal", "anti_diagonal", "no_winner"])
+def test_check_winner(placements, x_wins, o_wins):
+    """Test winning condition detection for every kind of line and for no line."""
+    # Reason: Verify that rows, columns and both diagonals are detected for the right player
+    # and that false positives don't occur when no line exists
+    
+    game = TicTacToe()  # Create new game instance
+    for row, col, symbol in placements:  # Place every piece of the case
+        game.board[row][col] = symbol  # Write the piece to the board
+    
+    assert game.check_winner('X') == x_wins  # Verify X is detected as winner only when expected
+    assert game.check_winner('O') == o_wins  # Verify O is detected as winner only when expected
+
+
+def test_is_draw_with_full_board_no_winner():
+    """Test draw detection with a full board and no winner."""
+    # Reason: Verify that draw conditions are detected correctly
+    # This tests the specific case where the board is full but no one won
+    
+    game = TicTacToe()  # Create new game instance
+    
+    # Create a full board with no winner
+    game.board = DRAW_BOARD_ROWS  # Fill every row with mixed symbols
+    
+    assert game.is_draw() == True  # Verify draw is detected
+
+
+def test_is_draw_with_winner_present():
+    """Test that draw is not detected when there's a winner."""
+    # Reason: Verify that draw detection doesn't trigger when someone has won
+    # This tests the error condition where a win exists
+    
+    game = TicTacToe()  # Create new game instance
+    
+    # Create a board with a winner
+    game.board[0] = ['X', 'X', 'X']  # Create winning row for X
+    game.board[1] = ['O', 'O', '']  # Add some other moves
+    game.board[2] = ['', '', '']  # Leave some positions empty
+    
+    assert game.is_draw() == False  # Verify draw is not detected when winner exists
+
+
+def test_is_draw_with_empty_board():
+    """Test that draw is not detected on an empty board."""
+    # Reason: Verify that draw detection only occurs when appropriate
+    # This tests the error condition of calling draw check too early
+    
+    game = TicTacToe()  # Create new game with empty board
+
+    assert game.is_draw() == False  # Verify draw is not detected on empty board
+
+
+def test_board_writes_update_bitboards():
+    """Test that writes through the board view update the bitboards."""
+    # Reason: Verify that the 3x3 grid view and the bitboards stay in sync
+    # This tests the happy path for cell and row assignment
+
+    game = TicTacToe()  # Create new game instance
+    game.board[0][1] = 'X'  # Write one cell through the view
+    game.board[2] = ['O', '', 'O']  # Write a whole row through the view
+
+    assert game.x == 1 << 1  # Player bit for (0,1) is set
+    assert game.o == (1 << 6) | (1 << 8)  # AI bits for (2,0) and (2,2) are set
+    assert game.board == [['', 'X', ''], ['', '', ''], ['O', '', 'O']]  # View matches plain lists
+
+
+def test_set_cell_overwrite_and_clear():
+    """Test overwriting and clearing cells keeps state consistent."""
+    # Reason: Verify that replacing a piece never leaves stale bits or encoding digits
+    # This tests the edge case of undoing and overwriting moves
+
+    game = TicTacToe()  # Create new game instance
+    empty_key = game.position_key(False)  # Key of the empty board
+
+    game.set_cell(1, 1, 'X')  # Place player piece
+    game.set_cell(1, 1, 'O')  # Overwrite with AI piece
+    assert game.x == 0 and game.o == 1 << 4  # Only the AI bit remains
+    assert game.get_cell(1, 1) == 'O'  # Cell reads back as AI
+
+    game.set_cell(1, 1, '')  # Clear the cell again
+    assert game.x == 0 and game.o == 0  # No bits remain
+    assert game.position_key(False) == empty_key  # Key returns to the empty board value
+    assert game.encoding == 0  # Encoding returns to the empty board value
+
+
+def test_game_uses_slots():
+    """Test that game state lives in slots rather than a per-instance dict."""
+    # Reason: Verify the memory layout and that typos in attribute names fail loudly
+    # This tests the error condition of assigning an unknown attribute
+
+    game = TicTacToe()  # Create new game instance
+    assert not hasattr(game, '__dict__')  # No per-instance dictionary
+    with pytest.raises(AttributeError):  # Unknown attributes cannot be added
+        game.bord = None  # Misspelled attribute name
+
+
+def test_set_cell_invalid_symbol():
+    """Test that invalid symbols are rejected."""
+    # Reason: Verify that bad input cannot corrupt the bitboards
+    # This tests the expected failure condition
+
+    game = TicTacToe()  # Create new game instance
+    try:
+        game.set_cell(0, 0, 'Z')  # Attempt to place an unknown symbol
+    except ValueError:  # Expected rejection
+        pass  # Invalid symbol was refused
+    else:
+        assert False, "set_cell should reject unknown symbols"  # Fail if nothing was raised
+    assert game.get_cell(0, 0) == ''  # Cell remains empty
+
+
+def test_reset_clears_game_in_place():
+    """Test that reset empties the board of the same game object."""
+    # Reason: Verify that a restarted game is indistinguishable from a new one
+    # This tests the happy path of reusing one game object across games
+
+    game = TicTacToe()  # Create new game instance
+    game.board[1][1] = 'X'  # Player takes the center
+    game.board[0][0] = 'O'  # AI takes a corner
+
+    game.reset()  # Start a new game on the same object
+    assert game.board == TicTacToe().board  # Board matches a fresh game
+    assert game.position_key(True) == TicTacToe().position_key(True)  # Key matches a fresh game
+    assert game.encoding == 0  # Encoding matches a fresh game
+
+
+def test_encoding_tracks_board():
+    """Test that the running encoding always matches encode_board."""
+    # Reason: Verify that the incremental encoding used by the winner table never drifts
+    # This tests placing, overwriting and clearing cells
+
+    game = TicTacToe()  # Create new game instance
+    game.board[0] = ['X', 'O', 'X']  # Fill the top row
+    game.board[2][2] = 'O'  # AI takes the bottom-right corner
+    game.board[0][1] = 'X'  # Overwrite the AI piece with a player piece
+    game.board[0][0] = ''  # Clear the top-left corner
+
+    cells = [cell for row in game.board for cell in row]  # Flatten the board
+    assert game.encoding == encode_board(cells)  # Incremental and full encodings agree
+
+
+def test_terminal_state():
+    """Test that terminal_state reports ongoing, won and drawn games."""
+    # Reason: Verify that the combined check agrees with check_winner and is_draw
+    # This tests the ongoing, winning and draw outcomes
+
+    game = TicTacToe()  # Create new game instance
+    assert game.terminal_state() is None  # Empty board is still in progress
+
+    game.board[0] = ['O', 'O', 'O']  # AI completes the top row
+    assert game.terminal_state() == 'O'  # AI win is reported
+
+    game.board[0] = ['X', 'X', 'X']  # Player completes the top row instead
+    assert game.terminal_state() == 'X'  # Player win is reported
+
+    game.board = DRAW_BOARD_ROWS  # Full board with no line for either side
+    assert game.terminal_state() == 'draw'  # Full board without a line
+
+
+def test_print_board_output():
+    """Test that the debug board printout shows pieces and empty-cell coordinates."""
+    # Reason: Verify the debugging aid still prints the familiar grid in one piece
+    # This tests a board with one piece for each player
+
+    game = TicTacToe()  # Create new game instance
+    game.board[1][1] = 'X'  # Player takes the center
+    game.board[0][2] = 'O'  # AI takes a corner
+
+    output = io.StringIO()  # Buffer that receives the printed board
+    with contextlib.redirect_stdout(output):  # Capture stdout without a pytest fixture
+        game.print_board()  # Print the board
+    lines = output.getvalue().splitlines()  # Captured output, line by line
+
+    assert lines[0] == "Current Board State:"  # Header comes first
+    assert lines[1] == "(0,0) | (0,1) | O"  # Empty cells show their coordinates
+    assert lines[3] == "(1,0) | X | (1,2)"  # Pieces show their symbol
+    assert len(lines) == 6  # Header, 3 rows and 2 separators
+
+
+# Reason: Run tests when this file is executed directly
+# This allows developers to run these tests on their own (python -m tests.test_tictactoe_board)
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-v"]))  # Execute all tests with verbose output
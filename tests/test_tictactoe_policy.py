@@ -0,0 +1,222 @@
+"""
+Unit tests for the AI's move selection.
+
+This module verifies find_best_move, the precomputed policy behind it and,
+in the slow exhaustive test, that the AI never loses a game.
+"""
+
+import pytest  # Import pytest for test markers
+
+from tests.boards import DRAW_BOARD_ROWS  # Import the shared full-board fixture
+from tictactoe_board import TicTacToe  # Import the game state the AI plays on
+from tictactoe_policy import _get_best_move_table, _solved_scores, find_best_move  # Import the policy to test
+from tictactoe_search import minimax  # Import the search the policy must agree with
+from tictactoe_tables import MAX_SCORE  # Import the bound on every search score
+
+
+# find_best_move tests
+
+def test_minimax_ai_blocks_player_win():
+    """Test that minimax recognizes when AI should block player win."""
+    # Reason: Verify that the algorithm makes defensive moves when necessary
+    # This tests the strategic decision-making capability of the AI
+    
+    game = TicTacToe()  # Create new game instance
+    
+    # Create situation where player is about to win
+    game.board[0] = ['X', 'X', '']  # Player has two in top row
+    game.board[1] = ['O', '', '']  # AI has one move in middle row
+    game.board[2] = ['', '', '']  # Bottom row is empty
+    
+    best_move = find_best_move(game)  # Get AI's optimal move
+    assert best_move == (0, 2)  # AI should block at position (0,2)
+
+
+def test_find_best_move_winning_opportunity():
+    """Test that AI takes a winning move when available."""
+    # Reason: Verify that the AI prioritizes winning over other moves
+    # This tests the happy path where AI can win immediately
+    
+    game = TicTacToe()  # Create new game instance
+    
+    # Create situation where AI can win
+    game.board[0] = ['O', 'O', '']  # AI has two in top row
+    game.board[1] = ['X', 'X', 'O']  # Mixed middle row
+    game.board[2] = ['', '', '']  # Bottom row empty
+    
+    best_move = find_best_move(game)  # Get AI's optimal move
+    assert best_move == (0, 2)  # AI should win by completing top row
+
+
+def test_find_best_move_blocking_priority():
+    """Test that AI blocks player win when no winning move available."""
+    # Reason: Verify that the AI makes defensive moves when it can't win
+    # This tests the edge case where blocking is the optimal strategy
+    
+    game = TicTacToe()  # Create new game instance
+    
+    # Create situation where player is about to win and AI can't win
+    game.board[0] = ['X', 'X', '']  # Player about to win top row
+    game.board[1] = ['O', '', '']  # AI has one piece in middle
+    game.board[2] = ['', '', '']  # Bottom row empty
+    
+    best_move = find_best_move(game)  # Get AI's optimal move
+    assert best_move == (0, 2)  # AI should block player's winning move
+
+
+def test_find_best_move_empty_board():
+    """Test that AI makes a reasonable first move on empty board."""
+    # Reason: Verify that the AI can start the game appropriately
+    # This tests the edge case of the very first move
+    
+    game = TicTacToe()  # Create new game with empty board
+    
+    best_move = find_best_move(game)  # Get AI's optimal first move
+    assert best_move is not None  # Verify a move is returned
+    assert isinstance(best_move, tuple)  # Verify return type is tuple
+    assert len(best_move) == 2  # Verify tuple has exactly 2 elements
+    
+    row, col = best_move  # Unpack the move coordinates
+    assert 0 <= row <= 2  # Verify row is within valid range
+    assert 0 <= col <= 2  # Verify column is within valid range
+
+
+def test_find_best_move_no_moves_available():
+    """Test behavior when no moves are available."""
+    # Reason: Verify graceful handling of edge case with full board
+    # This tests the error condition where no moves are possible
+    
+    game = TicTacToe()  # Create new game instance
+    
+    # Fill the entire board
+    game.board = DRAW_BOARD_ROWS  # Board with no empty cell left
+    
+    best_move = find_best_move(game)  # Attempt to find a move
+    assert best_move is None  # Verify None is returned when no moves available
+
+
+def test_find_best_move_time_budget():
+    """Test that an exhausted time budget still returns a legal move."""
+    # Reason: Verify that iterative deepening keeps the move of the last finished iteration
+    # This tests the edge case of a budget that expires after the first iteration
+    
+    game = TicTacToe()  # Create new game instance
+    
+    # Off-table position (O to move with more O than X) forces a real search
+    game.board[0] = ['O', '', '']  # AI holds a corner
+    game.board[1] = ['', 'O', '']  # AI holds the center
+    game.board[2] = ['', '', '']  # Bottom row is empty
+    
+    rushed_move = find_best_move(game, budget_ms=0)  # Only the first iteration may run
+    assert rushed_move is not None  # A move is always returned
+    assert game.board[rushed_move[0]][rushed_move[1]] == ''  # And it is a legal move
+    assert rushed_move == (2, 2)  # Even the shallowest iteration sees the immediate win
+
+
+def test_find_best_move_prefers_fastest_win():
+    """Test that the AI takes an immediate win over a slower forced win."""
+    # Reason: Verify that scores reward winning sooner, so the AI closes out won games
+    # This tests a board where every corner and edge also wins, just later
+
+    game = TicTacToe()  # Create new game instance
+    game.board[0] = ['O', '', '']  # AI holds a corner
+    game.board[1] = ['', 'O', '']  # AI holds the center
+    game.board[2] = ['', '', '']  # Bottom row is empty
+
+    assert find_best_move(game) == (2, 2)  # Completing the diagonal beats the earlier (0,1)
+
+
+def test_find_best_move_off_table_is_memoized():
+    """Test that solving an off-table position is cached for later calls."""
+    # Reason: Verify that a repeated request for the same position is a cache hit
+    # This tests the happy path of the memoized fallback search
+    
+    game = TicTacToe()  # Create new game instance
+    
+    # Off-table position (O to move with more O than X) forces a real search
+    game.board[0] = ['', '', 'O']  # AI holds a corner
+    game.board[1] = ['', 'O', '']  # AI holds the center
+    game.board[2] = ['X', '', '']  # Player blocked the anti-diagonal
+    
+    first_move = find_best_move(game)  # Solve the position
+    hits_before = _solved_scores.cache_info().hits  # Cache hits so far
+    assert find_best_move(game) == first_move  # Same answer the second time
+    assert _solved_scores.cache_info().hits == hits_before + 1  # Served from the cache
+
+
+# Policy table tests
+
+def test_policy_table_matches_search():
+    """Test that table lookups agree with a live minimax search."""
+    # Reason: Verify that undoing the symmetry transform returns the searched move
+    # This guards against an orientation bug returning a wrong or occupied cell
+
+    game = TicTacToe()  # Create new game instance
+    game.board[0][1] = 'X'  # Player opens on the top edge (non-canonical orientation)
+
+    best_move = find_best_move(game)  # Table-backed lookup
+
+    expected_move = None  # Recompute the move with a plain search
+    expected_score = -MAX_SCORE  # Start below every possible score for the maximizing AI
+    for row, col in game.get_available_moves():  # Evaluate each move in row-major order
+        game.board[row][col] = 'O'  # Temporarily make the AI move
+        score = minimax(game, 0, False)  # Score the move
+        game.board[row][col] = ''  # Undo the move
+        if score > expected_score:  # Keep the first best move
+            expected_score = score  # Update best score
+            expected_move = (row, col)  # Update best move
+
+    assert best_move == expected_move  # Table and search must agree
+
+
+def test_best_move_table_covers_every_orientation():
+    """Test that every orientation of a policy position is served by one lookup."""
+    # Reason: Verify that expanding the canonical table keeps each reply in the caller's orientation
+    # This tests the four corner openings, which share a single canonical entry
+
+    table = _get_best_move_table()  # Expanded best move table
+    for corner in ((0, 0), (0, 2), (2, 0), (2, 2)):  # Player opens in each corner
+        game = TicTacToe()  # Create new game instance
+        game.set_cell(*corner, 'X')  # Player takes the corner
+        best_move = table[game.position_key(True)]  # Direct lookup, no canonicalization
+        assert best_move == (1, 1)  # Center is the only reply that does not lose
+        assert find_best_move(game) == best_move  # Public API serves the same move
+
+
+# Exhaustive tests (slow, excluded by default; run with pytest -m slow)
+
+@pytest.mark.slow
+def test_ai_never_loses_any_game():
+    """Test that the AI wins or draws against every possible sequence of player moves."""
+    # Reason: Verify the "unbeatable" promise over the whole game tree, not just sample boards
+    # This plays out every game with the player moving first, as in the GUI
+    
+    game = TicTacToe()  # Create new game with empty board
+    finished_games = 0  # Count every game played to its end
+    
+    def play_out():
+        """Try every player move from the current position and let the AI answer each one."""
+        nonlocal finished_games  # Update the shared game counter
+        for row, col in game.get_available_moves():  # Every possible player move
+            game.set_cell(row, col, 'X')  # Make the player's move
+            assert not game.check_winner('X'), f"Player won:\n{game.board}"  # AI must never lose
+            if game.is_draw():  # Player filled the last cell
+                finished_games += 1  # Game ended in a draw
+            else:
+                ai_row, ai_col = find_best_move(game)  # AI answers
+                game.set_cell(ai_row, ai_col, 'O')  # Make the AI's move
+                if game.terminal_state() is None:  # Game continues
+                    play_out()  # Explore every player reply
+                else:  # AI won or drew
+                    finished_games += 1  # Count the finished game
+                game.set_cell(ai_row, ai_col, '')  # Undo the AI's move
+            game.set_cell(row, col, '')  # Undo the player's move
+    
+    play_out()  # Walk the whole game tree
+    assert finished_games > 0  # Games were actually played
+
+
+# Reason: Run tests when this file is executed directly
+# This allows developers to run these tests on their own (python -m tests.test_tictactoe_policy)
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-v"]))  # Execute all tests with verbose output
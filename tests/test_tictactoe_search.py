@@ -0,0 +1,185 @@
+"""
+Unit tests for the Minimax search.
+
+This module verifies minimax scores and windows, the transposition table
+entries it leaves behind, and the table-free search kernel.
+"""
+
+import random  # Import random to sample positions reproducibly
+
+import pytest  # Import pytest to run this module directly and for skip markers
+
+from tests.boards import DRAW_BOARD_ROWS  # Import the shared full-board fixture
+from tictactoe_board import TicTacToe  # Import the game state to search
+from tictactoe_search import (  # Import the search to test
+    HAS_EXTENSION, TRANSPOSITION_TABLE, TT_EXACT, TT_UPPER, _KERNEL_WIN_BITMAP, _negamax_kernel,
+    _py_negamax_kernel, minimax,
+)
+from tictactoe_tables import MAX_SCORE, WIN_BITMAP  # Import the window bound and the win table
+
+
+def setup_function():
+    """Start every test with an empty transposition table."""
+    # Reason: The table is module level and lives for the whole session, so a bound cached by an
+    # earlier test could answer a later query without a search and make results depend on test
+    # order; pytest runs this hook before every test function, and so does run_tests.py
+    TRANSPOSITION_TABLE.clear()  # Forget entries left behind by earlier tests
+
+
+# Minimax algorithm tests
+
+def test_minimax_ai_win_scenario():
+    """Test minimax returns a positive score when AI wins."""
+    # Reason: Verify that the algorithm correctly evaluates AI win conditions
+    # This tests the base case where the maximizing player (AI) has won
+    
+    game = TicTacToe()  # Create new game instance
+    
+    # Create a winning position for AI (O)
+    game.board[0] = ['O', 'O', 'O']  # AI wins with top row
+    game.board[1] = ['X', 'X', '']  # Add some player moves
+    game.board[2] = ['', '', '']  # Leave rest empty
+    
+    score = minimax(game, 0, True)  # Evaluate this position for AI
+    assert score == 5  # Verify AI win scores the 4 empty cells left plus 1
+
+
+def test_minimax_player_win_scenario():
+    """Test minimax returns a negative score when player wins."""
+    # Reason: Verify that the algorithm correctly evaluates player win conditions
+    # This tests the base case where the minimizing player (human) has won
+    
+    game = TicTacToe()  # Create new game instance
+    
+    # Create a winning position for player (X)
+    game.board[0] = ['X', 'X', 'X']  # Player wins with top row
+    game.board[1] = ['O', 'O', '']  # Add some AI moves
+    game.board[2] = ['', '', '']  # Leave rest empty
+    
+    score = minimax(game, 0, False)  # Evaluate this position for player
+    assert score == -5  # Verify player win scores minus the 4 empty cells left plus 1
+
+
+def test_minimax_draw_scenario():
+    """Test minimax returns 0 for draw scenarios."""
+    # Reason: Verify that the algorithm correctly evaluates draw conditions
+    # This tests the base case where neither player can win
+    
+    game = TicTacToe()  # Create new game instance
+    
+    # Create a draw position
+    game.board = DRAW_BOARD_ROWS  # Create full board with no winner
+    
+    score = minimax(game, 0, True)  # Evaluate this position
+    assert score == 0  # Verify draw returns score of 0
+
+
+def test_minimax_alpha_beta_window():
+    """Test that alpha-beta pruning keeps exact scores and bounds cut-off nodes."""
+    # Reason: Verify that pruning never changes the full-window result
+    # and that a narrowed window only ever returns a valid bound
+
+    game = TicTacToe()  # Create new game instance
+
+    # Create a position where AI (O) can force a win by completing the top row
+    game.board[0] = ['O', 'O', '']  # AI has two in top row
+    game.board[1] = ['X', 'X', '']  # Player has two in middle row
+    game.board[2] = ['X', '', '']  # Bottom row has one player move
+
+    assert minimax(game, 0, True) == 4  # Full window returns the exact AI win, 3 cells left after it
+    assert minimax(game, 0, True, -1, 0) >= 0  # Narrow window fails high with a lower bound
+    assert game.board[0][2] == ''  # Pruned search leaves the board untouched
+
+
+def test_minimax_exact_score_after_cached_bound():
+    """Test that an exact score is cached as exact even when a stored bound narrowed the window."""
+    # Reason: Verify that results are classified against the caller's window, not the window
+    # already narrowed by the transposition table probe
+    # This tests a narrow search that caches an upper bound, followed by a full-window search
+
+    game = TicTacToe()  # Create new game instance
+    game.board[0] = ['O', 'X', '']  # AI holds the top-left corner
+    game.board[1] = ['X', 'O', '']  # AI holds the center, so (2,2) completes the diagonal
+    game.board[2] = ['', 'X', '']  # Player took the bottom edge
+    key = game.position_key(True)  # Key of the position with AI to move
+
+    assert minimax(game, 0, True, 5, MAX_SCORE) <= 5  # Window above the true score fails low
+    assert TRANSPOSITION_TABLE[key][1] == TT_UPPER  # Only an upper bound was cached
+    assert minimax(game, 0, True) == 4  # Full window finds the exact AI win
+    assert TRANSPOSITION_TABLE[key][1:3] == (TT_EXACT, 4)  # Exact score replaced the bound
+
+
+def test_minimax_transposition_table_reuse():
+    """Test that searched positions are cached and reused."""
+    # Reason: Verify that the transposition table stores the root position
+    # and that a cached result matches a fresh evaluation
+
+    game = TicTacToe()  # Create new game instance
+    game.board[0] = ['X', '', '']  # Player opened in the corner
+    game.board[1] = ['', 'O', '']  # AI answered in the center
+    game.board[2] = ['', '', 'X']  # Player took the opposite corner
+
+    key = game.position_key(True)  # Key of the position with AI to move
+    assert key != game.position_key(False)  # Side to move is part of the key
+
+    first_score = minimax(game, 0, True)  # Search and populate the table
+    assert key in TRANSPOSITION_TABLE  # Root position was cached
+    assert minimax(game, 0, True) == first_score  # Cached result is consistent
+
+
+def test_minimax_stops_at_forced_win():
+    """Test that a forced win ends the search of a node with an exact score."""
+    # Reason: Verify that the early exit on a won position still caches an exact result
+    # This tests the full (-inf, +inf) window, where alpha-beta alone would not cut
+
+    game = TicTacToe()  # Create new game instance
+    game.board[0] = ['O', 'X', '']  # AI holds the top-left corner
+    game.board[1] = ['X', 'O', '']  # AI holds the center, so (2,2) completes the diagonal
+    game.board[2] = ['', '', '']  # Bottom row is open
+
+    assert minimax(game, 0, True) == 5  # AI wins at once, 4 cells left after it
+    _, flag, value, _ = TRANSPOSITION_TABLE[game.position_key(True)]  # Root entry
+    assert (flag, value) == (TT_EXACT, 5)  # Win was stored as exact, not as a bound
+
+
+def test_negamax_kernel_matches_minimax():
+    """Test that the table-free search kernel agrees with minimax."""
+    # Reason: Verify that the kernel (compiled with Numba when installed) scores like minimax
+    # This tests a won, a lost and an open position
+
+    game = TicTacToe()  # Create new game instance
+    game.board[0] = ['X', '', '']  # Player opened in the corner
+    game.board[1] = ['', 'O', '']  # AI answered in the center
+    window = (-MAX_SCORE, MAX_SCORE, _KERNEL_WIN_BITMAP)  # Full window and win table
+    assert -_negamax_kernel(game.x, game.o, 7, *window) == minimax(game, 0, False)
+
+    game.board[2] = ['X', 'X', '']  # Player threatens the bottom row
+    assert _negamax_kernel(game.x, game.o, 5, *window) == 5  # Player completes it, 4 cells left
+    assert _negamax_kernel(game.o, game.x, 5, *window) == minimax(game, 0, True)
+
+
+@pytest.mark.skipif(not HAS_EXTENSION, reason="minimax_ext is not built")
+def test_native_kernel_matches_python_kernel():
+    """Test that the Cython kernel scores sampled positions like the pure-Python kernel."""
+    # Reason: Verify that the compiled minimax_ext.negamax is a faithful port of _negamax_kernel
+    # This tests full and narrow windows, where both must return the same exact score or bound
+    
+    from minimax_ext import negamax  # Compiled kernel, importable whenever HAS_EXTENSION is set
+    
+    positions = [  # Every legal position with at least two pieces, as (mover, opponent, remaining)
+        (x, o, 9 - bin(x | o).count('1')) if bin(x).count('1') == bin(o).count('1')  # X to move
+        else (o, x, 9 - bin(x | o).count('1'))  # O to move
+        for x in range(1 << 9) for o in range(1 << 9)  # Every pair of bitboards
+        if not x & o and 0 <= bin(x).count('1') - bin(o).count('1') <= 1  # Legal piece counts
+        and bin(x | o).count('1') >= 2  # Small enough trees for the pure-Python kernel
+    ]
+    for mover, opponent, remaining in random.Random(0).sample(positions, 300):  # Reproducible sample
+        for alpha, beta in ((-MAX_SCORE, MAX_SCORE), (-1, 1), (0, 1)):  # Full and narrow windows
+            expected = _py_negamax_kernel(mover, opponent, remaining, alpha, beta, WIN_BITMAP)
+            assert negamax(mover, opponent, remaining, alpha, beta, WIN_BITMAP) == expected
+
+
+# Reason: Run tests when this file is executed directly
+# This allows developers to run these tests on their own (python -m tests.test_tictactoe_search)
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-v"]))  # Execute all tests with verbose output
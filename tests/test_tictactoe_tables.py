@@ -0,0 +1,86 @@
+"""
+Unit tests for the precomputed lookup tables and board symmetries.
+
+This module verifies the win and move-order tables, the base-3 board encoding
+and the canonical forms shared by symmetric boards.
+"""
+
+import pytest  # Import pytest to run this module directly
+
+from tictactoe_tables import (  # Import tables and helpers to test
+    ORDERED_EMPTY_INDICES, NO_HINT, WIN_BITMAP, WIN_MASKS, canonical_bitboards, canonicalize, encode_board,
+)
+
+
+# Lookup table tests
+
+def test_win_bitmap_matches_win_masks():
+    """Test that the 512-entry win table agrees with the winning line masks."""
+    # Reason: Verify the table the search relies on for every possible bitboard
+    # This tests the boundary patterns (empty, single lines, full board) along with the rest
+
+    for bits in range(1 << 9):  # Every 9-bit pattern
+        expected = any(bits & mask == mask for mask in WIN_MASKS)  # Scan the 8 lines directly
+        assert WIN_BITMAP[bits] == expected, f"bits={bits:09b}"  # Table must match the scan
+
+
+def test_ordered_empty_indices_lists_empty_cells():
+    """Test that the precomputed move lists hold exactly the empty cells in search order."""
+    # Reason: Verify that the search loop can trust the table instead of testing occupancy
+    # This tests the default order and a hint on an occupied and an empty cell
+
+    occupied = (1 << 4) | (1 << 0)  # Center and top-left corner taken
+    assert ORDERED_EMPTY_INDICES[NO_HINT][occupied] == (2, 6, 8, 1, 3, 5, 7)  # Corners, then edges
+    assert ORDERED_EMPTY_INDICES[5][occupied] == (5, 2, 6, 8, 1, 3, 7)  # Hinted edge moves to the front
+    assert ORDERED_EMPTY_INDICES[4][occupied] == ORDERED_EMPTY_INDICES[NO_HINT][occupied]  # Occupied hint is dropped
+    assert ORDERED_EMPTY_INDICES[NO_HINT][0b111111111] == ()  # Full board has no moves
+
+
+# Board encoding and symmetry tests
+
+def test_encode_board_values():
+    """Test that boards are packed into base-3 integers."""
+    # Reason: Verify the packing used as the policy table key
+    # This tests the happy path for empty and simple boards
+
+    assert encode_board([''] * 9) == 0  # Empty board encodes to zero
+    assert encode_board(['X'] + [''] * 8) == 1  # X in cell 0 contributes 1
+    assert encode_board([''] * 8 + ['O']) == 2 * 3 ** 8  # O in cell 8 contributes 2 * 3^8
+
+
+def test_canonicalize_symmetric_boards_share_key():
+    """Test that rotated and mirrored boards share one canonical key."""
+    # Reason: Verify that symmetric positions collapse to a single table entry
+    # This tests the edge case of every corner being equivalent
+
+    corner_keys = set()  # Collect canonical keys of X in each corner
+    for corner in (0, 2, 6, 8):  # Iterate through each corner cell
+        cells = [''] * 9  # Start from an empty flat board
+        cells[corner] = 'X'  # Place X in this corner
+        corner_keys.add(canonicalize(cells)[0])  # Record canonical key
+
+    assert len(corner_keys) == 1  # All corners are symmetric
+
+    edge_cells = [''] * 9  # Build a board with X on an edge instead
+    edge_cells[1] = 'X'  # Place X on the top edge
+    assert canonicalize(edge_cells)[0] not in corner_keys  # Edges are not equivalent to corners
+
+
+def test_canonical_bitboards_symmetric():
+    """Test that symmetric bitboards share one canonical form."""
+    # Reason: Verify the key used to share search results between symmetric boards
+    # This tests rotated copies of an asymmetric position
+
+    x = (1 << 0) | (1 << 5)  # Player on (0,0) and (1,2)
+    o = 1 << 4  # AI in the center
+    rotated_x = (1 << 2) | (1 << 7)  # Same position rotated 90 degrees clockwise
+    rotated_o = 1 << 4  # Center is fixed by every rotation
+
+    assert canonical_bitboards(x, o) == canonical_bitboards(rotated_x, rotated_o)  # Same canonical form
+    assert canonical_bitboards(x, o) != canonical_bitboards(1 << 0, 1 << 4)  # Different boards differ
+
+
+# Reason: Run tests when this file is executed directly
+# This allows developers to run these tests on their own (python -m tests.test_tictactoe_tables)
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-v"]))  # Execute all tests with verbose output
@@ -0,0 +1,258 @@
+"""
+Board state of the Smart Tic-Tac-Toe game.
+
+This module holds the TicTacToe game state, stored as bitboards, together with
+the live views that keep the familiar board[row][col] syntax working.
+"""
+
+from tictactoe_tables import (  # Import the precomputed tables the game state reads
+    AI_TO_MOVE_BIT, CELL_CODES, EMPTY_CELLS, FULL_BOARD, POW3, WINNER, WINNER_FLAGS, WINNER_O, WINNER_X,
+)
+
+
+class _BoardRow:
+    """
+    Live view of one board row that reads and writes through to the bitboards.
+    
+    Supports indexing, slicing, iteration, len() and comparison with plain lists so
+    callers can keep using the familiar board[row][col] syntax.
+    """
+    
+    __slots__ = ('_game', '_row')  # Views are created on every board[row] access, so keep them small
+    
+    def __init__(self, game, row):
+        self._game = game  # Game whose bitboards back this row
+        self._row = row  # Row index this view represents
+    
+    def __getitem__(self, col):
+        if isinstance(col, slice):  # Support row[:] style copies
+            return [self._game.get_cell(self._row, c) for c in range(3)[col]]  # Return plain list copy
+        return self._game.get_cell(self._row, range(3)[col])  # Read one cell (range handles negatives)
+    
+    def __setitem__(self, col, symbol):
+        self._game.set_cell(self._row, range(3)[col], symbol)  # Write through to the bitboards
+    
+    def __len__(self):
+        return 3  # Every row has exactly 3 cells
+    
+    def __iter__(self):
+        return iter(self[:])  # Iterate over a snapshot of the row symbols
+    
+    def __eq__(self, other):
+        return self[:] == list(other)  # Compare cell symbols with any sequence
+    
+    __hash__ = None  # Mutable view, so it must not be hashable
+    
+    def __repr__(self):
+        return repr(self[:])  # Display like a plain list
+
+
+class _BoardView:
+    """
+    Live 3x3 view of the bitboards that behaves like the original list-of-lists board.
+    """
+    
+    __slots__ = ('_game',)  # Views are created on every board access, so keep them small
+    
+    def __init__(self, game):
+        self._game = game  # Game whose bitboards back this view
+    
+    def __getitem__(self, row):
+        if isinstance(row, slice):  # Support board[:] style copies
+            return [_BoardRow(self._game, r) for r in range(3)[row]]  # Return list of row views
+        return _BoardRow(self._game, range(3)[row])  # Return a view of one row
+    
+    def __setitem__(self, row, symbols):
+        row = range(3)[row]  # Normalize negative indices
+        for col, symbol in enumerate(symbols):  # Write each provided cell of the row
+            self._game.set_cell(row, col, symbol)  # Write through to the bitboards
+    
+    def __len__(self):
+        return 3  # The board always has exactly 3 rows
+    
+    def __iter__(self):
+        return (_BoardRow(self._game, row) for row in range(3))  # Yield a view for each row
+    
+    def __eq__(self, other):
+        return [row[:] for row in self] == [list(row) for row in other]  # Compare symbols row by row
+    
+    __hash__ = None  # Mutable view, so it must not be hashable
+    
+    def __repr__(self):
+        return repr([row[:] for row in self])  # Display like a plain list of lists
+
+
+class TicTacToe:
+    """
+    Handles the core game state and logic for Tic-Tac-Toe.
+    
+    The state is stored as two 9-bit integers, x and o, where bit (row * 3 + col)
+    is set when that player occupies the cell, plus the running base-3 encoding
+    of the board (see tictactoe_tables.encode_board). For convenience and backward
+    compatibility, the board attribute exposes the same state as a 3x3 grid where:
+    - Empty cells contain ''
+    - Player moves are marked with 'X' 
+    - AI moves are marked with 'O'
+    """
+    
+    # Reason: Slots store the state at fixed offsets instead of in a per-instance __dict__, which
+    # makes attribute reads cheaper and the instance smaller; board stays a class-level property
+    __slots__ = ('x', 'o', 'encoding')
+    
+    def __init__(self):
+        # Reason: Two integers describe the whole board, so the search never needs to rescan it
+        self.x = 0  # Bitboard of player (X) pieces
+        self.o = 0  # Bitboard of AI (O) pieces
+        self.encoding = 0  # Base-3 encoding of the board, the index into WINNER
+    
+    def reset(self):
+        """Clear the board in place so the same game object can be reused for a new game."""
+        # Reason: Restarting reuses the existing game object instead of allocating a new one;
+        # the transposition table is module level, so the next game starts with a warm cache
+        self.x = 0  # No player pieces
+        self.o = 0  # No AI pieces
+        self.encoding = 0  # Encoding of the empty board
+    
+    @property
+    def board(self):
+        """Live 3x3 grid view of the bitboards supporting board[row][col] reads and writes."""
+        return _BoardView(self)  # Create a lightweight view over the bitboards
+    
+    @board.setter
+    def board(self, rows):
+        for row, symbols in enumerate(rows):  # Load each provided row
+            self.board[row] = symbols  # Write the row through the view
+    
+    def get_cell(self, row, col):
+        """
+        Get the symbol stored in a cell.
+        
+        Args:
+            row (int): Row index (0-2)
+            col (int): Column index (0-2)
+            
+        Returns:
+            str: 'X', 'O' or '' for an empty cell
+        """
+        bit = 1 << (row * 3 + col)  # Bit representing this cell
+        if self.x & bit:  # Player occupies the cell
+            return 'X'  # Return player symbol
+        if self.o & bit:  # AI occupies the cell
+            return 'O'  # Return AI symbol
+        return ''  # Cell is empty
+    
+    def set_cell(self, row, col, symbol):
+        """
+        Place a symbol in a cell, or clear it with ''.
+        
+        Args:
+            row (int): Row index (0-2)
+            col (int): Column index (0-2)
+            symbol (str): 'X', 'O' or '' to clear the cell
+        """
+        # Reason: All board writes funnel through here, so the bitboards and the running
+        # encoding can never disagree with what callers see through the board view
+        
+        if symbol not in CELL_CODES:  # Anything else is not a valid cell value
+            raise ValueError(f"Invalid cell symbol: {symbol!r}")  # Reject before any state changes
+        index = row * 3 + col  # Flat index of the cell
+        previous = self.get_cell(row, col)  # Symbol currently in the cell
+        if previous == symbol:  # Nothing to change
+            return  # Keep state as is
+        self.encoding += (CELL_CODES[symbol] - CELL_CODES[previous]) * POW3[index]  # Swap the cell's digit
+        bit = 1 << index  # Bit representing this cell
+        if previous != '':  # Remove the existing piece first
+            self.x &= ~bit  # Clear cell from player bitboard
+            self.o &= ~bit  # Clear cell from AI bitboard
+        if symbol == 'X':  # Place a player piece
+            self.x |= bit  # Set cell in player bitboard
+        elif symbol == 'O':  # Place an AI piece
+            self.o |= bit  # Set cell in AI bitboard
+        
+    def print_board(self):
+        """Print the current board state to console for debugging purposes."""
+        # Reason: This is debugging output only, so optimized runs (python -O) skip it entirely
+        # and the game and search code never print; the board is written with a single print call
+        
+        if not __debug__:  # Debug output is disabled under python -O
+            return  # Print nothing
+        lines = ["Current Board State:"]  # Header for debugging output
+        for i in range(3):  # Iterate through each row index
+            row_display = []  # Create list to hold formatted cell values for this row
+            for j in range(3):  # Iterate through each column index
+                cell = self.get_cell(i, j)  # Read the cell from the bitboards
+                row_display.append(cell if cell != '' else f'({i},{j})')  # Show coordinates for empty cells
+            lines.append(' | '.join(row_display))  # Join cells with separators
+            if i < 2:  # Don't add a separator after the last row
+                lines.append('-' * 15)  # Horizontal separator between rows
+        print('\n'.join(lines))  # Print the whole board at once
+    
+    def get_available_moves(self):
+        """
+        Get all empty cells on the board.
+        
+        Returns:
+            list: List of (row, col) tuples representing empty board positions
+        """
+        return list(EMPTY_CELLS[self.x | self.o])  # Precomputed empty cells of the occupied pattern
+    
+    def check_winner(self, player):
+        """
+        Check if the specified player has won the game.
+        
+        Args:
+            player (str): The player symbol to check ('X' or 'O')
+            
+        Returns:
+            bool: True if the player has won, False otherwise
+        """
+        # Reason: WINNER holds the result of checking all rows, columns and diagonals for every
+        # possible board, so the check is a single index with the running encoding
+        
+        return bool(WINNER[self.encoding] & WINNER_FLAGS[player])  # Win if the player's flag is set
+    
+    def is_draw(self):
+        """
+        Check if the game is a draw (board full with no winner).
+        
+        Returns:
+            bool: True if the game is a draw, False otherwise
+        """
+        # Reason: A draw occurs when the board is completely filled and neither player has won
+        # We need to verify both conditions: no winner exists and no empty spaces remain
+        
+        return not WINNER[self.encoding] and (self.x | self.o) == FULL_BOARD  # No line and no empty cell
+    
+    def terminal_state(self):
+        """
+        Classify the board as finished or ongoing with a single winner table lookup.
+        
+        Returns:
+            str: 'X' or 'O' for the winner, 'draw' for a full board without a line,
+                 or None while the game is still in progress
+        """
+        # Reason: Move handlers need both "did someone win?" and "is it a draw?"; answering
+        # both from one lookup avoids evaluating the board twice after every move
+        
+        flags = WINNER[self.encoding]  # Winner flags of the current board
+        if flags & WINNER_X:  # Player has a complete line
+            return 'X'  # Player won
+        if flags & WINNER_O:  # AI has a complete line
+            return 'O'  # AI won
+        if (self.x | self.o) == FULL_BOARD:  # No empty cell left
+            return 'draw'  # Full board without a winner
+        return None  # Game continues
+    
+    def position_key(self, ai_to_move):
+        """
+        Get the transposition table key of the current position.
+        
+        Args:
+            ai_to_move (bool): True if the AI (O) is the side to move
+            
+        Returns:
+            int: Both bitboards and the side to move packed into one exact integer
+        """
+        if ai_to_move:  # The search packs the side to move into the low bits
+            return self.o | self.x << 9 | AI_TO_MOVE_BIT  # AI pieces first, then the side bit
+        return self.x | self.o << 9  # Player pieces first
@@ -0,0 +1,273 @@
+"""
+Precomputed move policy for the Smart Tic-Tac-Toe AI.
+
+This module solves every position the AI can face once, caches the result on
+disk and answers find_best_move from it, searching only boards it does not cover.
+"""
+
+import os  # Import os module to locate the policy cache file next to this module
+from functools import lru_cache  # Import lru_cache to memoize solved off-table positions
+import pickle  # Import pickle to persist the precomputed policy table between runs
+from time import perf_counter  # Import high-resolution clock for the iterative deepening time budget
+
+from tictactoe_board import TicTacToe  # Import the game state used to load scratch boards
+from tictactoe_search import (  # Import the search that scores each move
+    HAS_COMPILED_KERNEL, _KERNEL_WIN_BITMAP, _negamax, _negamax_kernel,
+)
+from tictactoe_tables import (  # Import the tables and symmetries shared with the search
+    AI_TO_MOVE_BIT, CELL_CODES, MAX_SCORE, POW3, SYMMETRIES, canonical_bitboards, canonicalize, encode_board,
+)
+
+# Reason: The policy table is expensive to build once but free to reuse, so we persist it
+# The version number lets us invalidate stale caches whenever the scoring rules change
+_POLICY_VERSION = 2  # Bump whenever the stored policy format or scoring changes
+_POLICY_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tictactoe_policy.pkl')  # Cache location
+_policy_table = None  # Lazily loaded mapping of canonical board key to per-cell move scores
+_best_move_table = None  # Lazily built mapping of position key to the AI's (row, col) reply
+
+
+def _game_from_cells(cells):
+    """Create a TicTacToe game loaded with a flat sequence of 9 cell symbols."""
+    game = TicTacToe()  # Start from an empty board
+    game.board = [cells[row * 3:row * 3 + 3] for row in range(3)]  # Load flat cells row by row
+    return game  # Return the loaded game
+
+
+def _score_moves(board, draft=None):
+    """
+    Score every empty cell of a board with the minimax algorithm.
+    
+    Args:
+        board (TicTacToe): Board with 'O' to move
+        draft (int): Plies to search after each AI move (default: until the game ends)
+        
+    Returns:
+        tuple: 9 scores indexed by flat cell, None for occupied cells
+    """
+    # Reason: Scores for all moves (rather than a single best move) let callers break ties in
+    # their own board orientation, exactly like a plain row-major scan would
+    # Moves leading to symmetric boards (e.g. the 4 corners of an empty board) have the same
+    # score, so only the first move of each symmetry class is actually searched
+    
+    scores = []  # Collect one score per flat cell
+    class_scores = {}  # Score of each canonical child board searched so far
+    occupied = board.x | board.o  # Bitboard of all occupied cells
+    remaining = 9 - bin(occupied).count('1')  # Empty cells before the AI move
+    if draft is None:  # No horizon requested
+        draft = remaining  # Search every remaining ply
+    for index in range(9):  # Evaluate every cell in flat order
+        bit = 1 << index  # Bit representing this cell
+        if occupied & bit:  # Occupied cells cannot be played
+            scores.append(None)  # Mark occupied cell with no score
+            continue  # Move on to the next cell
+        child = canonical_bitboards(board.x, board.o | bit)  # Canonical board after this move
+        if child not in class_scores:  # First move of this symmetry class
+            if HAS_COMPILED_KERNEL and draft >= remaining - 1:  # Full-depth search, use the compiled kernel
+                class_scores[child] = -_negamax_kernel(  # Score the move assuming the player replies next
+                    board.x, board.o | bit, remaining - 1, -MAX_SCORE, MAX_SCORE, _KERNEL_WIN_BITMAP
+                )
+            else:  # Pure Python, or a depth-limited iteration, uses the transposition table search
+                class_scores[child] = -_negamax(  # Score the move assuming the player replies next
+                    board.x, board.o | bit, False, remaining - 1, draft, -MAX_SCORE, MAX_SCORE
+                )
+        scores.append(class_scores[child])  # Reuse the score of the symmetric move
+    return tuple(scores)  # Return immutable scores tuple
+
+
+@lru_cache(maxsize=None)
+def _solved_scores(x, o):
+    """
+    Score every move of a position to the end of the game, memoized per position.
+    
+    Args:
+        x (int): Bitboard of player (X) pieces
+        o (int): Bitboard of AI (O) pieces, with 'O' to move
+        
+    Returns:
+        tuple: 9 exact scores indexed by flat cell, None for occupied cells
+    """
+    # Reason: The policy table only covers positions reachable in a real game; hand-built
+    # positions are solved on demand, and since a board has at most 3**9 encodings the
+    # cache stays small while repeated requests for the same board become a lookup
+    
+    game = TicTacToe()  # Scratch game holding the position
+    for index in range(9):  # Load both bitboards cell by cell
+        if x >> index & 1:  # Player piece on this cell
+            game.set_cell(index // 3, index % 3, 'X')  # Place player piece
+        elif o >> index & 1:  # AI piece on this cell
+            game.set_cell(index // 3, index % 3, 'O')  # Place AI piece
+    return _score_moves(game)  # Full-depth scores of every move
+
+
+def _build_policy_table():
+    """
+    Precompute move scores for every canonical board the AI can face.
+    
+    Returns:
+        dict: Mapping of canonical board key to a tuple of 9 per-cell scores
+    """
+    # Reason: Tic-Tac-Toe only has a few thousand reachable positions (a few hundred after
+    # symmetry), so solving them all once turns every later AI turn into a dictionary lookup
+    # We walk the game tree breadth-first from the empty board with the player (X) moving first
+    
+    table = {}  # Mapping of canonical key to move scores
+    empty = ('',) * 9  # The empty board, which is also scored for an AI opening move
+    table[canonicalize(empty)[0]] = _score_moves(TicTacToe())  # Solve the AI opening position
+    
+    frontier = [empty]  # Boards at the current ply, all with the player (X) to move
+    seen = {encode_board(empty)}  # Avoid expanding the same board twice
+    player = 'X'  # The player always opens the game in the GUI
+    while frontier:  # Keep expanding until no non-terminal boards remain
+        next_frontier = []  # Collect boards reached after one more move
+        for cells in frontier:  # Expand every board of the current ply
+            for index in range(9):  # Try placing the current symbol in every cell
+                if cells[index] != '':  # Skip occupied cells
+                    continue  # Move on to the next cell
+                child = cells[:index] + (player,) + cells[index + 1:]  # Build the child board
+                key = encode_board(child)  # Encode child to detect duplicates
+                if key in seen:  # Skip boards reached through another move order
+                    continue  # Move on to the next cell
+                seen.add(key)  # Record the board as visited
+                game = _game_from_cells(child)  # Scratch game used to test for terminal states
+                if game.check_winner(player) or game.is_draw():  # Terminal boards need no move
+                    continue  # Do not expand finished games
+                if player == 'X':  # After the player's move it is the AI's turn
+                    canonical_key, permutation = canonicalize(child)  # Collapse symmetric boards
+                    if canonical_key not in table:  # Only solve each canonical board once
+                        canonical_cells = [child[source] for source in permutation]  # Canonical layout
+                        table[canonical_key] = _score_moves(_game_from_cells(canonical_cells))  # Solve it
+                next_frontier.append(child)  # Queue the child for expansion
+        frontier = next_frontier  # Advance to the next ply
+        player = 'O' if player == 'X' else 'X'  # Alternate the symbol placed each ply
+    return table  # Return the complete policy table
+
+
+def _get_policy_table():
+    """
+    Return the policy table, loading it from disk or building it on first use.
+    
+    Returns:
+        dict: Mapping of canonical board key to a tuple of 9 per-cell scores
+    """
+    # Reason: Load lazily so importing the module stays cheap, and persist the table with
+    # pickle so only the very first run pays the one-time cost of solving every position
+    
+    global _policy_table  # Cache the table at module level for the rest of the session
+    if _policy_table is not None:  # Table already available in this session
+        return _policy_table  # Reuse the in-memory table
+    
+    try:
+        with open(_POLICY_CACHE_PATH, 'rb') as cache_file:  # Open the cached policy table
+            version, table = pickle.load(cache_file)  # Read version tag and table
+        if version == _POLICY_VERSION:  # Only trust caches built with the current rules
+            _policy_table = table  # Use the cached table
+    except Exception:  # Missing, unreadable or corrupt cache of any kind
+        pass  # Fall through and rebuild the table
+    
+    if _policy_table is None:  # No usable cache was found
+        _policy_table = _build_policy_table()  # Solve every position once
+        # Reason: Several processes (e.g. parallel test workers) may build the table at once, so
+        # each writes a private temporary file and atomically renames it over the cache;
+        # readers then see either no cache or a complete one, never a half-written file
+        temp_path = f"{_POLICY_CACHE_PATH}.{os.getpid()}.tmp"  # Per-process temporary file
+        try:
+            with open(temp_path, 'wb') as cache_file:  # Persist the table for later runs
+                pickle.dump((_POLICY_VERSION, _policy_table), cache_file)  # Store version with table
+            os.replace(temp_path, _POLICY_CACHE_PATH)  # Publish the complete cache atomically
+        except OSError:  # Read-only install location or similar
+            try:
+                os.remove(temp_path)  # Do not leave a partial temporary file behind
+            except OSError:  # Temporary file was never created
+                pass  # Nothing to clean up
+    return _policy_table  # Return the ready table
+
+
+def _get_best_move_table():
+    """
+    Return the best move of every policy position in every orientation, building it on first use.
+    
+    Returns:
+        dict: Mapping of position key (AI to move) to the (row, col) of the best move
+    """
+    # Reason: The policy table stores one canonical board per symmetry class, so a lookup still
+    # has to canonicalize the board first; expanding every entry into its 8 orientations once
+    # (a few thousand boards) turns each later AI turn into a single dictionary lookup
+    
+    global _best_move_table  # Cache the table at module level for the rest of the session
+    if _best_move_table is not None:  # Table already available in this session
+        return _best_move_table  # Reuse the in-memory table
+    
+    table = {}  # Mapping of position key to best move
+    for canonical_key, canonical_scores in _get_policy_table().items():  # Every canonical position
+        codes = [canonical_key // POW3[index] % 3 for index in range(9)]  # Base-3 digit of each cell
+        for permutation in SYMMETRIES:  # Place the canonical board in every orientation
+            x = o = 0  # Bitboards of this orientation
+            scores = [None] * 9  # Per-cell scores in this orientation
+            for canonical_index, code in enumerate(codes):  # Canonical cell i is board cell permutation[i]
+                bit = 1 << permutation[canonical_index]  # Cell in this orientation
+                if code == CELL_CODES['X']:  # Player piece
+                    x |= bit  # Set cell in player bitboard
+                elif code == CELL_CODES['O']:  # AI piece
+                    o |= bit  # Set cell in AI bitboard
+                scores[permutation[canonical_index]] = canonical_scores[canonical_index]  # Move score
+            table[o | x << 9 | AI_TO_MOVE_BIT] = _pick_best_move(scores)  # Break ties in this orientation
+    _best_move_table = table  # Publish the complete table
+    return _best_move_table  # Return the ready table
+
+
+def _pick_best_move(scores):
+    """
+    Pick the first cell (in row-major order) with the highest score.
+    
+    Args:
+        scores (sequence): 9 scores indexed by flat cell, None for occupied cells
+        
+    Returns:
+        tuple: (row, col) of the best move, or None if every cell is occupied
+    """
+    best_move = None  # Initialize variable to store the optimal move
+    best_score = -MAX_SCORE  # Start below every possible score for the maximizing AI
+    for index, score in enumerate(scores):  # Scan cells in row-major order
+        if score is not None and score > best_score:  # Strictly better keeps the earliest of equal moves
+            best_score = score  # Update best score
+            best_move = divmod(index, 3)  # Convert flat index to (row, col)
+    return best_move  # Return the coordinates of the optimal move
+
+
+def find_best_move(board, budget_ms=None):
+    """
+    Find the optimal move for the AI using the minimax algorithm.
+    
+    Args:
+        board (TicTacToe): Current game board state
+        budget_ms (float): Time after which no deeper search iteration is started (default: no limit)
+        
+    Returns:
+        tuple: (row, col) coordinates of the best move, or None if no moves available
+    """
+    # Reason: Positions reachable in a real game are served from the precomputed best move table
+    # Any other position (e.g. hand-built boards) falls back to evaluating each move with minimax
+    
+    best_move = _get_best_move_table().get(board.position_key(True))  # Look up the precomputed reply
+    if best_move is not None:  # Position is covered by the policy table
+        return best_move  # Same move the canonical scores pick in the caller's orientation
+    
+    # Reason: Iterative deepening searches 1 ply, then 2, ... so the move of the deepest finished
+    # iteration is always available when the time budget runs out, and the best moves stored
+    # in the transposition table by each iteration order the moves of the next one
+    
+    if budget_ms is None:  # No time limit, so only the final, complete iteration matters
+        return _pick_best_move(_solved_scores(board.x, board.o))  # Solve (or recall) the position
+    
+    start_time = perf_counter()  # Start of the time budget
+    remaining = 9 - bin(board.x | board.o).count('1')  # Plies left until the board is full
+    best_move = None  # Move of the deepest completed iteration
+    for draft in range(remaining):  # Plies searched after the AI move, up to the end of the game
+        if best_move is not None and (perf_counter() - start_time) * 1000 > budget_ms:  # Budget spent
+            break  # Keep the move of the last completed iteration
+        if draft == remaining - 1:  # Final iteration searches to the end of the game
+            scores = _solved_scores(board.x, board.o)  # Solve (or recall) the position
+        else:  # Depth-limited iteration
+            scores = _score_moves(board, draft)  # Search draft plies after each AI move
+        best_move = _pick_best_move(scores)  # Complete one deeper iteration
+    return best_move  # Return the move of the deepest completed search
@@ -0,0 +1,269 @@
+"""
+Minimax search for the Smart Tic-Tac-Toe AI.
+
+This module holds the negamax search behind minimax, backed by a session-wide
+transposition table, and the table-free kernel that runs as machine code when
+the Cython extension or Numba is available.
+"""
+
+from tictactoe_tables import (  # Import the precomputed tables the search reads
+    AI_TO_MOVE_BIT, MAX_SCORE, MOVE_ORDER_INDICES, NO_HINT, ORDERED_EMPTY_INDICES, SYMMETRIES,
+    SYMMETRY_INVERSES, SYMMETRY_MIN_EMPTY, WIN_BITMAP, _canonical_form,
+)
+
+# Reason: A prebuilt Cython extension (cythonize -i minimax_ext.pyx) runs the search kernel as C
+# code with no start-up cost; failing that, Numba can compile the kernel to machine code, but it
+# is a heavy optional dependency that also compiles on first use; without either everything
+# runs in pure Python so Tk-only installs keep working
+try:
+    from minimax_ext import negamax as _native_negamax  # Ahead-of-time compiled search kernel
+    HAS_EXTENSION = True  # Native kernel is available
+except ImportError:  # Extension was not built for this interpreter
+    HAS_EXTENSION = False  # Try Numba, then pure Python
+
+HAS_NUMBA = False  # Only needed (and imported) when the native extension is missing
+if not HAS_EXTENSION:
+    try:
+        import numpy as np  # Numba kernels read lookup tables from numpy arrays
+        from numba import njit  # Just-in-time compiler for the search kernel
+        HAS_NUMBA = True  # Compiled kernel is available
+    except ImportError:  # Numba (or numpy) is not installed
+        pass  # Use the pure-Python search
+HAS_COMPILED_KERNEL = HAS_EXTENSION or HAS_NUMBA  # True when the kernel runs as machine code
+
+# Reason: The transposition table remembers searched positions across calls for the whole session
+# Each entry is (draft, flag, value, best_index); the flag tells whether value is exact or only a
+# lower/upper bound, because alpha-beta cutoffs can stop a search before the exact score is known
+# The draft is how many plies below the node were searched, and best_index is the move that
+# produced value, which later (deeper) searches of the same node try first
+TT_EXACT = 0  # Stored value is the exact minimax score
+TT_LOWER = 1  # Stored value is a lower bound (search failed high)
+TT_UPPER = 2  # Stored value is an upper bound (search failed low)
+TRANSPOSITION_TABLE = {}  # Maps packed position key to (draft, flag, value, best_index)
+
+
+def minimax(board, depth, is_maximizing, alpha=-MAX_SCORE, beta=MAX_SCORE):
+    """
+    Minimax algorithm with alpha-beta pruning for optimal AI decision making.
+    
+    This recursive algorithm evaluates all possible game states to find the optimal move.
+    It assumes both players play optimally. Branches that cannot change the result are
+    pruned, so the returned score is exact whenever it lies strictly inside (alpha, beta).
+    Searched positions are remembered in a session-wide transposition table.
+    
+    Args:
+        board (TicTacToe): Current game board state
+        depth (int): Unused; kept only for compatibility with existing callers
+        is_maximizing (bool): True if it's AI's turn (maximizing), False if player's turn (minimizing)
+        alpha (int): Best score the maximizing AI is already guaranteed (default: -MAX_SCORE)
+        beta (int): Best score the minimizing player is already guaranteed (default: MAX_SCORE)
+        
+    Returns:
+        int: Score of the current board state: positive for an AI win, negative for a player
+             win, 0 for a draw; a win or loss scores (empty cells left when it happens) + 1
+    """
+    # Reason: The recursive search works on the raw bitboards only, so no board object is
+    # touched (or needs restoring) inside the hot loop
+    # The search scores boards for the side to move, so the AI's window and score are
+    # mirrored whenever the player is the one to move
+    
+    remaining = 9 - bin(board.x | board.o).count('1')  # Plies left until the board is full
+    if WIN_BITMAP[board.o]:  # Check if AI (O) has won, even if the player also has a line
+        return remaining + 1  # Return positive score for AI win
+    
+    if is_maximizing:  # AI to move, so its score is already the AI's score
+        return _negamax(board.o, board.x, True, remaining, remaining, alpha, beta)  # Search every ply
+    return -_negamax(board.x, board.o, False, remaining, remaining, -beta, -alpha)  # Mirror the player's score
+
+
+def _negamax(mover, opponent, ai_to_move, remaining, draft, alpha, beta):
+    """
+    Recursive negamax alpha-beta search over bitboards backed by the transposition table.
+    
+    Args:
+        mover (int): Bitboard of the side to move
+        opponent (int): Bitboard of the side that just moved
+        ai_to_move (bool): True if the side to move is the AI (O), False for the player (X)
+        remaining (int): Number of empty cells, i.e. plies until the board is full
+        draft (int): Plies left to search before scoring an unfinished board as a draw
+        alpha (int): Lower bound of the search window, for the side to move
+        beta (int): Upper bound of the search window, for the side to move
+        
+    Returns:
+        int: Score for the side to move, exact if inside (alpha, beta), otherwise a bound
+    """
+    # Reason: Tic-Tac-Toe is zero-sum, so a position is worth to one side exactly minus what it
+    # is worth to the other; scoring every node for the side to move and negating child scores
+    # (negamax) lets one branch serve both players instead of mirrored max/min branches
+    
+    if WIN_BITMAP[opponent]:  # Check if the side that just moved has won
+        return -remaining - 1  # Return negative score, the side to move has lost
+    
+    if WIN_BITMAP[mover]:  # Check if the side to move already has a line (hand-built boards)
+        return remaining + 1  # Return positive score, the side to move has won
+    
+    if remaining == 0:  # Board is full with no winner
+        return 0  # Return neutral score for draw
+    
+    if draft == 0:  # Search horizon reached before the game ended
+        return 0  # Unresolved boards are scored like a draw
+    
+    # Reason: Different move orders reach the same board (transpositions); reuse earlier work
+    # Exact entries answer immediately, bound entries narrow the window and may cause a cutoff
+    # A draft of at least remaining means the whole subtree was searched, so the score is final
+    
+    draft = min(draft, remaining)  # Searching past a full board adds nothing
+    if remaining >= SYMMETRY_MIN_EMPTY:  # Near the root, share one entry between symmetric boards
+        canonical_mover, canonical_opponent, symmetry = _canonical_form(mover, opponent)  # Canonical form
+        tt_key = canonical_mover | canonical_opponent << 9  # Pack the canonical board
+    else:  # Deeper boards are cached as they are
+        tt_key = mover | opponent << 9  # Pack the board itself
+        symmetry = 0  # Stored moves are already in this board's orientation
+    if ai_to_move:  # Side to move is part of the position
+        tt_key |= AI_TO_MOVE_BIT  # Mark the AI as the side to move
+    
+    # Reason: The result is classified against the caller's window, so it is captured before
+    # cached bounds narrow alpha or beta; otherwise an exact score found inside the narrowed
+    # window would be stored as a one-sided bound and overwrite a better entry
+    alpha_original = alpha  # Remember window to classify the result afterwards
+    beta_original = beta  # Remember window to classify the result afterwards
+    
+    hint_slot = NO_HINT  # Default order: center, corners, edges
+    entry = TRANSPOSITION_TABLE.get(tt_key)  # Probe the transposition table
+    if entry is not None:  # Position was searched before
+        entry_draft, flag, value, hint = entry  # Unpack the cached result
+        if entry_draft >= draft:  # Entry searched at least as deep as needed
+            if flag == TT_EXACT:  # Cached score is exact
+                return value  # No search needed
+            if flag == TT_LOWER:  # Cached score is a lower bound
+                alpha = max(alpha, value)  # The true score is at least this high
+            else:  # Cached score is an upper bound
+                beta = min(beta, value)  # The true score is at most this high
+            if alpha >= beta:  # Window closed by the cached bound
+                return value  # Bound is enough to decide this node
+        # Reason: Even a shallower entry knows which move was best last time, and trying it
+        # first usually produces the cutoff immediately (the payoff of iterative deepening)
+        hint_slot = SYMMETRIES[symmetry][hint]  # Stored move in this orientation first
+    
+    # Reason: Alpha-beta pruning stops exploring a node as soon as alpha >= beta, because the
+    # opponent already has a better alternative elsewhere and will never allow this line
+    # Trying strong moves first (MOVE_ORDER) makes those cutoffs happen as early as possible
+    
+    best_score = -MAX_SCORE  # Worse than any real score for the side to move
+    best_index = None  # Move that produced best_score
+    for index in ORDERED_EMPTY_INDICES[hint_slot][mover | opponent]:  # Empty cells, strongest first
+        score = -_negamax(  # Make the move and score the reply from the opponent's side
+            opponent, mover | 1 << index, not ai_to_move, remaining - 1, draft - 1, -beta, -alpha
+        )
+        if score > best_score:  # Found a better move for the side to move
+            best_score, best_index = score, index  # Keep track of the highest score found
+            if score == remaining:  # Winning with this very move cannot be beaten
+                break  # Skip the remaining moves
+            if score > alpha:  # Raise the score the side to move is guaranteed
+                alpha = score  # New lower bound
+                if alpha >= beta:  # The opponent will never allow this line
+                    break  # Prune the remaining moves
+    
+    if best_score <= alpha_original:  # Failed low: true score may be even lower
+        flag = TT_UPPER  # Store as an upper bound
+    elif best_score >= beta_original:  # Failed high: true score may be even higher
+        flag = TT_LOWER  # Store as a lower bound
+    else:  # Score landed inside the window
+        flag = TT_EXACT  # Store as exact
+    hint = SYMMETRY_INVERSES[symmetry][best_index]  # Store the best move in the key's orientation
+    TRANSPOSITION_TABLE[tt_key] = (draft, flag, best_score, hint)  # Share the result with later searches
+    return best_score  # Return the best score for the side to move
+
+
+def _negamax_kernel(mover, opponent, remaining, alpha, beta, win_bitmap):
+    """
+    Plain negamax alpha-beta search over bitboards, written so Numba can compile it.
+    
+    Args:
+        mover (int): Bitboard of the side to move
+        opponent (int): Bitboard of the side that just moved
+        remaining (int): Number of empty cells, i.e. plies until the board is full
+        alpha (int): Lower bound of the search window, for the side to move
+        beta (int): Upper bound of the search window, for the side to move
+        win_bitmap (sequence): WIN_BITMAP as bytes, or as a uint8 array when compiled
+        
+    Returns:
+        int: Score for the side to move, exact if inside (alpha, beta), otherwise a bound
+    """
+    # Reason: Only integer operations and array lookups are used (no dicts, sets or objects),
+    # which is the subset Numba compiles to tight machine code; the compiled version needs no
+    # transposition table because searching the whole tree is already cheap at native speed
+    # It scores boards for the side to move like _negamax, so the side itself is not needed
+    
+    if win_bitmap[opponent]:  # Check if the side that just moved has won
+        return -remaining - 1  # Return negative score, the side to move has lost
+    if win_bitmap[mover]:  # Check if the side to move already has a line (hand-built boards)
+        return remaining + 1  # Return positive score, the side to move has won
+    if remaining == 0:  # Board is full with no winner
+        return 0  # Return neutral score for draw
+    
+    # Reason: The search walks the tree with an explicit stack instead of recursing, so no call
+    # frame is created per node; frame sp of each array holds one node on the current path,
+    # and at most 10 nodes (the root plus 9 plies) are ever on it at once
+    
+    movers = [0] * 10  # Bitboard of the side to move at each stack frame
+    opponents = [0] * 10  # Bitboard of the side that just moved at each stack frame
+    remainings = [0] * 10  # Empty cells at each stack frame
+    alphas = [0] * 10  # Lower bound of each frame's window
+    betas = [0] * 10  # Upper bound of each frame's window
+    bests = [0] * 10  # Best score found so far at each frame
+    cursors = [0] * 10  # Position in MOVE_ORDER_INDICES of each frame's next move
+    movers[0], opponents[0], remainings[0] = mover, opponent, remaining  # Root position
+    alphas[0], betas[0], bests[0] = alpha, beta, -MAX_SCORE  # Root window, no move tried yet
+    sp = 0  # Index of the frame being searched
+    
+    while True:
+        cursor = cursors[sp]  # Next move to try at this frame
+        occupied = movers[sp] | opponents[sp]  # Bitboard of all occupied cells
+        while cursor < 9 and occupied >> MOVE_ORDER_INDICES[cursor] & 1:  # Skip occupied cells
+            cursor += 1  # Move on to the next candidate square
+        
+        if cursor == 9:  # Every move of this frame is searched (or the rest were pruned)
+            if sp == 0:  # Root frame finished
+                return bests[0]  # Return the best score for the side to move
+            score = -bests[sp]  # Child score seen from its parent
+            sp -= 1  # Pop back to the parent frame
+        else:  # Make the next move
+            cursors[sp] = cursor + 1  # Resume after this move when control returns here
+            child_remaining = remainings[sp] - 1  # Empty cells after the move
+            child_opponent = movers[sp] | 1 << MOVE_ORDER_INDICES[cursor]  # Mover's pieces after the move
+            if win_bitmap[child_opponent]:  # The move wins on the spot
+                score = child_remaining + 1  # Score a win with child_remaining cells left
+            elif child_remaining == 0:  # The move fills the board without a line
+                score = 0  # Score a draw
+            else:  # The reply has to be searched, so push a frame for it
+                sp += 1  # New frame for the opponent's reply
+                movers[sp], opponents[sp] = opponents[sp - 1], child_opponent  # Swap sides
+                remainings[sp] = child_remaining  # Empty cells of the child
+                alphas[sp], betas[sp] = -betas[sp - 1], -alphas[sp - 1]  # Negated, swapped window
+                bests[sp], cursors[sp] = -MAX_SCORE, 0  # No move tried yet
+                continue  # Search the child before scoring this move
+        
+        if score > bests[sp]:  # Found a better move for the side to move
+            bests[sp] = score  # Keep track of the highest score found
+            if score == remainings[sp]:  # Winning with this very move cannot be beaten
+                cursors[sp] = 9  # Skip the remaining moves
+            elif score > alphas[sp]:  # Raise the score the side to move is guaranteed
+                alphas[sp] = score  # New lower bound
+                if score >= betas[sp]:  # The opponent will never allow this line
+                    cursors[sp] = 9  # Prune the remaining moves
+
+
+_py_negamax_kernel = _negamax_kernel  # Pure-Python kernel, the reference for the compiled versions
+
+# Reason: Compile once per install (cache=True keeps the machine code in __pycache__) and warm the
+# kernel at import so the first AI turn does not pay the compilation cost
+if HAS_EXTENSION:
+    _negamax_kernel = _native_negamax  # Same signature and scores, already machine code
+    _KERNEL_WIN_BITMAP = WIN_BITMAP  # Extension reads the bytes through a memoryview
+elif HAS_NUMBA:
+    _negamax_kernel = njit(cache=True)(_negamax_kernel)  # Replace the kernel with its compiled form
+    _KERNEL_WIN_BITMAP = np.frombuffer(WIN_BITMAP, dtype=np.uint8)  # Win table in a Numba-friendly array
+    _negamax_kernel(0, 0, 9, -MAX_SCORE, MAX_SCORE, _KERNEL_WIN_BITMAP)  # Trigger compilation (or cache load) now
+else:
+    _KERNEL_WIN_BITMAP = WIN_BITMAP  # Pure-Python kernel indexes the bytes directly
@@ -0,0 +1,222 @@
+"""
+Precomputed lookup tables and board symmetries for the Smart Tic-Tac-Toe AI.
+
+Everything here is built once at import: the win tables, the move orders, the
+8 board symmetries and the board encodings shared by the game state, the search
+and the move policy.
+"""
+
+# Reason: Encode each cell as a base-3 digit so a whole board packs into one small integer
+# Packed integers are cheap to hash and compare, which makes them ideal dictionary keys
+CELL_CODES = {'': 0, 'X': 1, 'O': 2}  # Map each cell symbol to its base-3 digit
+
+
+def _build_symmetries():
+    """
+    Build the 8 symmetries of the 3x3 board (4 rotations, each with and without a mirror).
+
+    Returns:
+        tuple: Index permutations where transformed[i] = original[perm[i]] on a flat board
+    """
+    # Reason: Tic-Tac-Toe is invariant under the D4 symmetry group of the square
+    # Expressing each symmetry as a permutation of the 9 flat indices makes applying it trivial
+
+    coordinate_maps = (  # Each map sends a (row, col) of the transformed board to a source cell
+        lambda r, c: (r, c),  # Identity
+        lambda r, c: (2 - c, r),  # Rotate 90 degrees clockwise
+        lambda r, c: (2 - r, 2 - c),  # Rotate 180 degrees
+        lambda r, c: (c, 2 - r),  # Rotate 270 degrees clockwise
+        lambda r, c: (r, 2 - c),  # Mirror left-right
+        lambda r, c: (2 - r, c),  # Mirror top-bottom
+        lambda r, c: (c, r),  # Mirror across the main diagonal
+        lambda r, c: (2 - c, 2 - r),  # Mirror across the anti-diagonal
+    )
+    permutations = []  # Collect one index permutation per symmetry
+    for coordinate_map in coordinate_maps:  # Convert each coordinate map into flat indices
+        source_cells = [coordinate_map(r, c) for r in range(3) for c in range(3)]  # Source cell per target cell
+        permutations.append(tuple(r * 3 + c for r, c in source_cells))  # Store as flat index tuple
+    return tuple(permutations)  # Return immutable tuple of all 8 permutations
+
+
+SYMMETRIES = _build_symmetries()  # Precompute the 8 board symmetries once at import
+
+# Reason: Alpha-beta pruning cuts the most branches when strong moves are searched first
+# The center touches 4 winning lines, corners touch 3 and edges only 2
+MOVE_ORDER = ((1, 1), (0, 0), (0, 2), (2, 0), (2, 2), (0, 1), (1, 0), (1, 2), (2, 1))  # Center, corners, edges
+
+# Reason: The two 9-bit bitboards plus one side-to-move bit already identify a position exactly,
+# so packing them into one integer gives a collision-free key that costs two shifts and two ORs
+AI_TO_MOVE_BIT = 1 << 18  # Key bit set when the AI (maximizing side) is to move
+
+# Reason: A finished game is scored by the empty cells left, so a quicker win scores higher and a
+# slower loss scores less negative; the score depends only on the position, never on the path
+# that reached it, which keeps transposition table entries valid wherever they are reused
+# Search windows are bounded by the plain int MAX_SCORE instead of float infinities, so the hot
+# loop never mixes float and int comparisons
+MAX_SCORE = 10  # Larger than any score magnitude (a win leaves at most 9 - 3 = 6 empty cells)
+
+
+# Reason: Store each player's pieces as a 9-bit integer (bit row*3+col set = piece on that cell)
+# Win and fullness checks then become a few integer operations instead of nested list scans
+FULL_BOARD = 0b111111111  # Bit pattern with every cell occupied
+WIN_MASKS = (  # Bit patterns of the 8 winning lines
+    0b000000111, 0b000111000, 0b111000000,  # Rows 0, 1 and 2
+    0b001001001, 0b010010010, 0b100100100,  # Columns 0, 1 and 2
+    0b100010001, 0b001010100,  # Main diagonal and anti-diagonal
+)
+WINS = frozenset(  # Every 9-bit pattern that contains at least one winning line
+    bits for bits in range(1 << 9) if any(bits & mask == mask for mask in WIN_MASKS)  # Precomputed once
+)
+WINNER_X = 1  # WINNER flag: the player (X) has a complete line
+WINNER_O = 2  # WINNER flag: the AI (O) has a complete line
+POW3 = tuple(3 ** index for index in range(9))  # Base-3 place value of each flat cell
+
+
+def _build_winner_table():
+    """
+    Build the winner flags of every base-3 board encoding.
+    
+    Returns:
+        bytearray: 3**9 entries of WINNER_X / WINNER_O flags (0 when nobody has a line)
+    """
+    # Reason: Every pair of non-overlapping bitboards is exactly one base-3 encoding, so walking
+    # the pairs fills all 19683 entries without decoding any board digit by digit
+    
+    x_codes = [  # Base-3 code of each X bitboard
+        sum(POW3[i] * CELL_CODES['X'] for i in range(9) if bits >> i & 1) for bits in range(1 << 9)
+    ]
+    o_codes = [  # Base-3 code of each O bitboard
+        sum(POW3[i] * CELL_CODES['O'] for i in range(9) if bits >> i & 1) for bits in range(1 << 9)
+    ]
+    table = bytearray(3 ** 9)  # One flag byte per encoding, 0 = no winner
+    for x in range(1 << 9):  # Every player bitboard
+        x_flag = WINNER_X if x in WINS else 0  # Does the player have a line
+        free = FULL_BOARD & ~x  # Cells the AI may occupy
+        o = free  # Walk every subset of the free cells, from all of them down to none
+        while True:  # Walk subsets until the empty one
+            table[x_codes[x] + o_codes[o]] = x_flag | (WINNER_O if o in WINS else 0)  # Combine flags
+            if o == 0:  # Empty subset done, all AI bitboards for this x covered
+                break  # Move on to the next player bitboard
+            o = (o - 1) & free  # Next smaller subset of the free cells
+    return table  # Return the complete table
+
+
+# Reason: Tic-Tac-Toe only has 3**9 = 19683 encodings, so the winner of every board fits in a
+# 20 KB table and checking a game reduces to indexing it with the game's running encoding
+WINNER = _build_winner_table()  # WINNER[encoding] holds the WINNER_X / WINNER_O flags of that board
+WINNER_FLAGS = {'X': WINNER_X, 'O': WINNER_O}  # Flag tested for each player symbol
+# Reason: The search only ever asks whether one side's bitboard holds a line, and with 512
+# possible bitboards the answer for each fits in one byte, so the test is a single subscript
+WIN_BITMAP = bytes(bits in WINS for bits in range(1 << 9))  # WIN_BITMAP[bits] is 1 if bits contain a line
+MOVE_ORDER_INDICES = tuple(row * 3 + col for row, col in MOVE_ORDER)  # MOVE_ORDER as flat bit indices
+EMPTY_CELLS = tuple(  # EMPTY_CELLS[occupied] lists the (row, col) of every empty cell in row-major order
+    tuple(divmod(index, 3) for index in range(9) if not occupied >> index & 1) for occupied in range(1 << 9)
+)
+HINTED_MOVE_ORDERS = tuple(  # HINTED_MOVE_ORDERS[i] is MOVE_ORDER_INDICES with cell i moved to the front
+    (hint,) + tuple(index for index in MOVE_ORDER_INDICES if index != hint) for hint in range(9)
+) + (MOVE_ORDER_INDICES,)  # HINTED_MOVE_ORDERS[NO_HINT] keeps the default order
+NO_HINT = 9  # Hint slot used when no earlier search suggested a move
+
+# Reason: The search only ever loops over the empty cells of a board, so filtering each move order
+# by every occupied pattern up front leaves the hot loop with no per-cell occupancy test
+ORDERED_EMPTY_INDICES = tuple(  # ORDERED_EMPTY_INDICES[hint][occupied] lists empty cells in search order
+    tuple(tuple(index for index in order if not occupied >> index & 1) for occupied in range(1 << 9))
+    for order in HINTED_MOVE_ORDERS  # One table per hint slot, including NO_HINT
+)
+
+# Reason: Applying a symmetry to a bitboard bit by bit is slow, so precompute, for each of the
+# 8 symmetries, the transformed value of all 512 possible bitboards; a transform is then one index
+SYMMETRY_BIT_TABLES = tuple(  # SYMMETRY_BIT_TABLES[s][bits] is bits transformed by symmetry s
+    tuple(  # Lookup table for one symmetry
+        sum(1 << target for target in range(9) if bits >> permutation[target] & 1)  # Move each bit to its target
+        for bits in range(1 << 9)  # Cover every possible 9-bit pattern
+    )
+    for permutation in SYMMETRIES  # One table per symmetry
+)
+
+SYMMETRY_INVERSES = tuple(  # SYMMETRY_INVERSES[s][i] is the transformed cell holding original cell i
+    tuple(permutation.index(index) for index in range(9)) for permutation in SYMMETRIES
+)
+
+# Reason: Searching is only worth canonicalizing near the root, where up to 8 symmetric boards
+# would otherwise be searched separately; deeper boards are rarely symmetric and plentiful
+SYMMETRY_MIN_EMPTY = 7  # Canonicalize boards with at least this many empty cells (root and its children)
+
+
+def canonical_bitboards(x, o):
+    """
+    Find the canonical form of a bitboard pair under the 8 board symmetries.
+    
+    Args:
+        x (int): Bitboard of player (X) pieces
+        o (int): Bitboard of AI (O) pieces
+        
+    Returns:
+        tuple: (x, o) of the symmetric board with the smallest packed value
+    """
+    # Reason: All 8 symmetric versions of a board share the same minimax score, so using the
+    # smallest one as the cache key lets them all share one transposition table entry
+    
+    best_x, best_o, _ = _canonical_form(x, o)  # Drop the symmetry, callers only need the board
+    return best_x, best_o  # Return the canonical bitboards
+
+
+def _canonical_form(x, o):
+    """
+    Find the canonical bitboards of a board together with the symmetry that produces them.
+    
+    Args:
+        x (int): Bitboard of player (X) pieces
+        o (int): Bitboard of AI (O) pieces
+        
+    Returns:
+        tuple: (x, o, symmetry) where symmetry indexes SYMMETRIES and SYMMETRY_BIT_TABLES
+    """
+    best_x, best_o, best_symmetry = x, o, 0  # Start with the identity transform
+    best_packed = x | o << 9  # Pack both bitboards into one comparable integer
+    for symmetry, table in enumerate(SYMMETRY_BIT_TABLES):  # Try every rotation and reflection
+        tx, to = table[x], table[o]  # Transform both bitboards with one lookup each
+        packed = tx | to << 9  # Pack the transformed board
+        if packed < best_packed:  # Keep the smallest packed board
+            best_x, best_o, best_packed, best_symmetry = tx, to, packed, symmetry  # Remember new canonical form
+    return best_x, best_o, best_symmetry  # Return the canonical bitboards and their symmetry
+
+
+def encode_board(cells):
+    """
+    Pack a flat 9-cell board into a single base-3 integer.
+    
+    Args:
+        cells (sequence): Flat sequence of 9 cell symbols ('', 'X' or 'O')
+        
+    Returns:
+        int: Base-3 encoding of the board (0 for an empty board)
+    """
+    # Reason: A packed integer is a compact, hashable key for caching board evaluations
+    # Cell i contributes its code multiplied by 3**i so every board maps to a unique number
+    
+    return sum(CELL_CODES[cell] * 3 ** i for i, cell in enumerate(cells))  # Combine cell digits into one integer
+
+
+def canonicalize(cells):
+    """
+    Find the canonical representative of a board under the 8 board symmetries.
+    
+    Args:
+        cells (sequence): Flat sequence of 9 cell symbols
+        
+    Returns:
+        tuple: (key, permutation) where key is the smallest encoding among all symmetric
+               boards and permutation maps canonical cell indices back to the given board
+    """
+    # Reason: Rotated or mirrored boards share the same best move (up to the same symmetry)
+    # Storing only the smallest encoding collapses up to 8 equivalent boards into one entry
+    
+    best_key = None  # Track the smallest encoding seen so far
+    best_permutation = None  # Track the symmetry that produced the smallest encoding
+    for permutation in SYMMETRIES:  # Try every rotation and reflection of the board
+        key = encode_board([cells[source] for source in permutation])  # Encode the transformed board
+        if best_key is None or key < best_key:  # Keep the smallest encoding as canonical
+            best_key = key  # Remember new canonical key
+            best_permutation = permutation  # Remember the symmetry that produced it
+    return best_key, best_permutation  # Return canonical key and its symmetry